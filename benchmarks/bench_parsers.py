@@ -0,0 +1,115 @@
+"""
+Time the YouTube page parsers on recorded real-world responses, without any network access.
+
+Record the responses once on a machine with internet access, then replay them anywhere:
+
+    python benchmarks/bench_parsers.py --record benchmarks/fixtures --query "lofi hip hop"
+    python benchmarks/bench_parsers.py --fixtures benchmarks/fixtures --rounds 20
+
+Each case runs one of the real lookup functions (server and CLI search, playlist search, the playlist extractor)
+with streamledge.fixtures serving the recorded responses, so the timings are parsing work only. The query and
+playlist used when recording are saved with the fixtures. Fixtures can also be recorded from normal use and replayed
+by the CLI or server with the STREAMLEDGE_UPSTREAM_RECORD / STREAMLEDGE_UPSTREAM_REPLAY environment variables.
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from bench_routes import write_config
+from streamledge import fixtures
+
+def extract_playlist(server, playlist_id):
+    shutil.rmtree(server.PLAYLIST_CHECKPOINT_DIR, ignore_errors=True)  # parse from the first page every round
+    return server.YouTubePlaylistExtractor().extract_all_videos(playlist_id, resume_in_background=False)
+
+def make_cases(server, client, query, playlist_id):
+    """case name -> function running the lookup and returning its result"""
+    cases = {
+        'server youtube_search': lambda: server.youtube_search(query),
+        'server youtube_search_playlist': lambda: server.youtube_search_playlist(query),
+        'client youtube_search (videos)': lambda: client.youtube_search(query, search_type='video'),
+        'client youtube_search (playlists)': lambda: client.youtube_search(query, search_type='playlist'),
+        'server /api/search (playlists)': lambda: client.youtube_search(
+            query, search_type='playlist', fetch=server.search_fetch, map_items=server.map_concurrently),
+    }
+    if playlist_id:
+        cases['server YouTubePlaylistExtractor'] = lambda: extract_playlist(server, playlist_id)
+    return cases
+
+def describe(result):
+    if isinstance(result, (list, tuple)) and len(result) != 2:
+        return f"{len(result)} items"
+    return repr(result)[:50]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--record', metavar='DIR', help="fetch live and save the responses to DIR")
+    mode.add_argument('--fixtures', metavar='DIR', help="replay the responses saved in DIR")
+    parser.add_argument('--query', default='lofi hip hop', help="search query to record (default: %(default)s)")
+    parser.add_argument('--playlist', help="playlist ID to record (default: first playlist found for --query)")
+    parser.add_argument('--rounds', type=int, default=10, help="timed runs per case")
+    parser.add_argument('--cases', help="comma separated case names to run (default: all)")
+    args = parser.parse_args()
+
+    fixture_dir = os.path.abspath(args.record or args.fixtures)
+    cases_path = os.path.join(fixture_dir, 'cases.json')
+    os.makedirs(fixture_dir, exist_ok=True)
+    if args.fixtures:
+        try:
+            with open(cases_path) as f:
+                recorded = json.load(f)
+        except (OSError, ValueError) as e:
+            sys.exit(f"No recorded fixtures in {fixture_dir} ({e}). Record them first with --record {fixture_dir}")
+        fixtures.REPLAY_DIR = fixture_dir
+    else:
+        fixtures.RECORD_DIR = fixture_dir
+
+    # Throwaway config folder, so no real config, caches or playlist checkpoints are used
+    config_dir = tempfile.mkdtemp(prefix='streamledge-bench-')
+    os.environ['XDG_CONFIG_HOME'] = config_dir
+    write_config(config_dir)
+    import streamledge.main as client
+    import streamledge_server.main as server
+
+    try:
+        if args.record:
+            playlist_id = args.playlist
+            if not playlist_id:
+                found = server.youtube_search_playlist(args.query)
+                playlist_id = found[1] if found else None
+            recorded = {'query': args.query, 'playlist': playlist_id}
+            cases = make_cases(server, client, args.query, playlist_id)
+            for name, case in cases.items():
+                print(f"Recording {name}: {describe(case())}")
+            with open(cases_path, 'w') as f:
+                json.dump(recorded, f)
+            print(f"Fixtures saved to {fixture_dir}")
+            return
+
+        cases = make_cases(server, client, recorded['query'], recorded.get('playlist'))
+        if args.cases:
+            cases = {name: cases[name] for name in args.cases.split(',') if name in cases}
+        print(f"Replaying '{recorded['query']}' / playlist {recorded.get('playlist')}, {args.rounds} rounds per case")
+        print(f"{'case':<36}{'min ms':>9}{'p50 ms':>9}{'mean ms':>9}  result")
+        for name, case in cases.items():
+            result = case()  # warm-up, and a check that everything it needs was recorded
+            if not result:
+                print(f"{name:<36}  no result - were its responses recorded? (try --record again)")
+                continue
+            timings = []
+            for _ in range(args.rounds):
+                start = time.perf_counter()
+                case()
+                timings.append((time.perf_counter() - start) * 1000)
+            print(f"{name:<36}{min(timings):>9.2f}{statistics.median(timings):>9.2f}{statistics.mean(timings):>9.2f}  {describe(result)}")
+    finally:
+        shutil.rmtree(config_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+"""
+End-to-end latency and throughput of every streamledge_server route against local stub upstreams (no network needed).
+
+Starts benchmarks/stub_upstreams.py in-process and the real streamledge_server in a subprocess with a throwaway
+config folder and STREAMLEDGE_UPSTREAM_BASE_URL pointing at the stubs. For each serving mode, every route gets
+--requests requests from --concurrency client threads, and the script reports throughput, latency percentiles,
+non-200 responses and upstream requests per launch.
+
+By default every request asks for content the server hasn't seen (every lookup goes upstream).
+--keys N cycles through N IDs per route instead, so after the first N requests lookups hit the server's caches.
+
+    python benchmarks/bench_routes.py
+    python benchmarks/bench_routes.py --modes production,async --concurrency 32 --requests 400 --latency 0.15 --jitter 0.05
+    python benchmarks/bench_routes.py --routes twitch_live,kick_live --failure-rate 0.05 --failure-mode 429
+    python benchmarks/bench_routes.py --keys 10 --fast-render
+"""
+import argparse
+import os
+import re
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+from bench_server_modes import percentile, run_clients
+import stub_upstreams
+
+def youtube_video_id(prefix, key):
+    return f"{prefix}{key:0{11 - len(prefix)}d}"
+
+# route name -> function(key) returning the request path; each route has its own ID prefix so routes don't share cache entries
+ROUTES = {
+    'youtube_video': lambda k: f"/youtube?id={youtube_video_id('yv', k)}",
+    'youtube_mix': lambda k: f"/youtube?id=RD{youtube_video_id('ym', k)}",
+    'youtube_playlist': lambda k: f"/youtube?id=PL{k:032d}&shuffle=false",
+    'youtube_shuffle': lambda k: f"/youtube?id=PLs{k:031d}&shuffle=true",
+    'search_video': lambda k: f"/youtube_search?q=video+{k}",
+    'search_playlist': lambda k: f"/youtube_search?q=playlist+{k}&searchType=playlist&shuffle=false",
+    'twitch_live': lambda k: f"/twitch?channel=live{k}&quality=720p60",
+    'twitch_vod': lambda k: f"/twitch?channel=vod{k}&contentType=vod&quality=720p60",
+    'twitch_vodid': lambda k: f"/twitch?contentType=vodid&vodid={3000000000 + k}&quality=480p",
+    'twitch_clip': lambda k: f"/clip?id=BenchClip{k}",
+    'kick_live': lambda k: f"/kick?channel=kick{k}",
+    'kick_vod': lambda k: f"/kick?channel=kickvod{k}&contentType=vod",
+    'titles_api': lambda k: "/api/titles?ids=" + ','.join(youtube_video_id('ta', k * 10 + n) for n in range(10)),
+}
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def write_config(config_dir, detect_desktop=False, **server_settings):
+    """
+    config.ini in the config folder used with XDG_CONFIG_HOME=config_dir: the default config with the given [Server] settings.
+    Unless detect_desktop, the window position and browser path are fixed so nothing about the desktop (or its absence) is probed.
+    """
+    from streamledge import config_utils
+
+    text = config_utils.DEFAULT_CONFIG
+    for key, value in server_settings.items():
+        text = re.sub(rf'^{key} = .*$', f"{key} = {value}", text, count=1, flags=re.MULTILINE)
+    for key, value in () if detect_desktop else (('x_pos', 0), ('y_pos', 0), ('browser_path', sys.executable)):
+        text = re.sub(rf'^# {key} = .*$', f"{key} = {value}", text, count=1, flags=re.MULTILINE)
+    config_path = os.path.join(config_dir, 'streamledge', 'config.ini')  # where platformdirs looks with XDG_CONFIG_HOME=config_dir
+    os.makedirs(os.path.dirname(config_path), exist_ok=True)
+    with open(config_path, 'w') as f:
+        f.write(text)
+
+def start_server(mode, stub_url, args):
+    """Run streamledge_server in a subprocess with its own config folder, returns (process, port, config folder)"""
+    config_dir = tempfile.mkdtemp(prefix=f'streamledge-bench-{mode}-')
+    port = free_port()
+    write_config(
+        config_dir, port=port, server_mode=mode, workers=args.workers, request_queue=args.queue,
+        fast_render=str(args.fast_render).lower(), stream_response=str(args.stream_response).lower()
+    )
+    env = dict(os.environ, XDG_CONFIG_HOME=config_dir, STREAMLEDGE_UPSTREAM_BASE_URL=stub_url,
+               PYTHONPATH=os.pathsep.join(filter(None, [SRC_DIR, os.environ.get('PYTHONPATH')])))
+    log = open(os.path.join(config_dir, 'server.log'), 'w')
+    process = subprocess.Popen([sys.executable, '-m', 'streamledge_server'], env=env, stdout=log, stderr=subprocess.STDOUT)
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            break
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/api/titles", timeout=1).read()
+            return process, port, config_dir
+        except OSError:
+            time.sleep(0.1)
+    stop_server(process)
+    with open(os.path.join(config_dir, 'server.log')) as f:
+        sys.exit(f"streamledge_server ({mode}) did not start:\n{f.read()}")
+
+def stop_server(process):
+    process.terminate()
+    try:
+        process.wait(10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+def bench_route(port, route, args, stubs):
+    """run_clients() with a path per request, returns the result row"""
+    def path(n):
+        return ROUTES[route](n % args.keys if args.keys else n)
+
+    stubs.reset_counts()
+    latencies, statuses, wall, _ = run_clients(port, args.concurrency, args.requests, path=path)
+    upstream_requests = sum(stubs.reset_counts().values())
+    ms = [value * 1000 for value in latencies]
+    return (
+        f"{route:<18}{len(latencies) / wall:>8.1f}{percentile(ms, 50):>9.1f}{percentile(ms, 90):>9.1f}"
+        f"{percentile(ms, 99):>9.1f}{max(ms):>9.1f}{sum(count for status, count in statuses.items() if status != 200):>7}"
+        f"{upstream_requests / len(latencies):>10.2f}"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modes', default='production,async', help="comma separated serving modes (development, production, async)")
+    parser.add_argument('--routes', default=','.join(ROUTES), help="comma separated routes: " + ', '.join(ROUTES))
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=200, help="requests per route")
+    parser.add_argument('--keys', type=int, default=0, help="distinct IDs per route (0 = every request asks for new content)")
+    parser.add_argument('--workers', type=int, default=16)
+    parser.add_argument('--queue', type=int, default=64)
+    parser.add_argument('--fast-render', action='store_true', help="serve pages before their title is known")
+    parser.add_argument('--stream-response', action='store_true', help="stream the start of player pages")
+    stub_upstreams.add_arguments(parser)
+    args = parser.parse_args()
+
+    # Keep the files streamledge writes to its config folder (caches) out of the real one
+    import_dir = tempfile.mkdtemp(prefix='streamledge-bench-')
+    os.environ['XDG_CONFIG_HOME'] = import_dir
+    routes = args.routes.split(',')
+    for route in routes:
+        if route not in ROUTES:
+            parser.error(f"unknown route '{route}'")
+
+    stubs = stub_upstreams.start(args)
+    stub_url = f"http://127.0.0.1:{stubs.server_address[1]}"
+    print(
+        f"{args.requests} requests per route, {args.concurrency} concurrent clients, upstream latency {args.latency * 1000:.0f} ms"
+        f"{f' +/- {args.jitter * 1000:.0f} ms' if args.jitter else ''}"
+        f"{f', {args.failure_rate:.0%} upstream failures ({args.failure_mode})' if args.failure_rate else ''}"
+        f", {f'{args.keys} IDs per route' if args.keys else 'no repeated IDs'}"
+    )
+    for mode in args.modes.split(','):
+        process, port, config_dir = start_server(mode, stub_url, args)
+        try:
+            print(f"\n{mode}")
+            print(f"{'route':<18}{'req/s':>8}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'max ms':>9}{'!200':>7}{'upstream':>10}")
+            for route in routes:
+                print(bench_route(port, route, args, stubs), flush=True)
+        finally:
+            stop_server(process)
+            shutil.rmtree(config_dir, ignore_errors=True)
+    stubs.shutdown()
+    shutil.rmtree(import_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+"""
+Compare the streamledge_server serving modes under concurrent load.
+
+Each mode serves a small Flask app whose player route is an upstream flow that pauses for --delay
+seconds, like a route waiting on YouTube/Twitch (a blocking sleep under the WSGI servers, a
+non-blocking one on the async server). N client threads send requests as fast as they are answered, and the
+script reports throughput, latency percentiles, 503 rejections and the peak number of threads.
+
+    python benchmarks/bench_server_modes.py --concurrency 64 --requests 2000 --delay 0.05
+    python benchmarks/bench_server_modes.py --modes development,async --concurrency 300 --delay 0.5
+"""
+import argparse
+import asyncio
+import http.client
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from flask import Flask
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+from streamledge_server import upstream
+from streamledge_server.asgi import create_asgi_app, serve_async
+from streamledge_server.wsgi_server import PooledRequestHandler, PooledWSGIServer
+
+class QuietHandler(WSGIRequestHandler):
+    def log_request(self, *args, **kwargs):
+        pass
+
+class QuietPooledHandler(PooledRequestHandler):
+    def log_request(self, *args, **kwargs):
+        pass
+
+def make_app(delay):
+    app = Flask(__name__)
+    body = "<html>" + "x" * 2048 + "</html>"
+
+    @app.route('/')
+    @upstream.view
+    def player():
+        yield upstream.pause(delay)  # stands in for the upstream lookups of a real route
+        return body
+
+    return app
+
+def start_development(app, port, args):
+    server = make_server('127.0.0.1', port, app, threaded=True, request_handler=QuietHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server.shutdown
+
+def start_production(app, port, args):
+    server = PooledWSGIServer(
+        '127.0.0.1', port, app,
+        workers=args.workers, request_queue=args.queue, connection_timeout=args.connection_timeout,
+        handler=QuietPooledHandler
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server.shutdown_gracefully
+
+def start_async(app, port, args):
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    task = loop.create_task(serve_async(create_asgi_app(app), '127.0.0.1', port, args.connection_timeout, ready=ready))
+
+    def run():
+        try:
+            loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            pass
+        loop.close()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    ready.wait(5)
+
+    def stop():
+        loop.call_soon_threadsafe(task.cancel)
+        thread.join(15)
+
+    return stop
+
+# mode -> function(app, port, args) that starts serving in the background and returns a stop function
+SERVERS = {
+    'development': start_development,
+    'production': start_production,
+    'async': start_async,
+}
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def run_clients(port, concurrency, total_requests, path='/'):
+    """`path` is the request path, or a function returning the path of the nth request"""
+    latencies = []
+    statuses = {}
+    lock = threading.Lock()
+    remaining = [total_requests]
+
+    def client():
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        while True:
+            with lock:
+                if remaining[0] <= 0:
+                    break
+                remaining[0] -= 1
+                n = total_requests - remaining[0] - 1
+            start = time.perf_counter()
+            try:
+                conn.request('GET', path(n) if callable(path) else path)
+                response = conn.getresponse()
+                response.read()
+                status = response.status
+                if response.will_close:
+                    conn.close()
+            except (OSError, http.client.HTTPException):
+                status = 'error'
+                conn.close()
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+                statuses[status] = statuses.get(status, 0) + 1
+        conn.close()
+
+    peak_threads = [threading.active_count()]
+    done = threading.Event()
+
+    def watch_threads():
+        while not done.wait(0.01):
+            peak_threads[0] = max(peak_threads[0], threading.active_count())
+
+    watcher = threading.Thread(target=watch_threads, daemon=True)
+    watcher.start()
+    clients = [threading.Thread(target=client) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in clients:
+        thread.start()
+    for thread in clients:
+        thread.join()
+    wall = time.perf_counter() - start
+    done.set()
+    watcher.join()
+    # client threads, the watcher and the main thread are not server threads
+    return latencies, statuses, wall, peak_threads[0] - concurrency - 2
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modes', default=','.join(SERVERS), help="comma separated serving modes to compare")
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--delay', type=float, default=0.05, help="seconds each request blocks (simulated upstream)")
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--queue', type=int, default=32)
+    parser.add_argument('--connection-timeout', type=int, default=5)
+    args = parser.parse_args()
+
+    app = make_app(args.delay)
+    print(f"{args.requests} requests, {args.concurrency} concurrent clients, {args.delay * 1000:.0f} ms per request")
+    print(f"{'mode':<14}{'req/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}{'503':>7}{'errors':>8}{'threads':>9}")
+    for mode in args.modes.split(','):
+        port = free_port()
+        stop = SERVERS[mode](app, port, args)
+        try:
+            latencies, statuses, wall, threads = run_clients(port, args.concurrency, args.requests)
+        finally:
+            stop()
+        ms = [value * 1000 for value in latencies]
+        print(
+            f"{mode:<14}{len(latencies) / wall:>9.0f}{statistics.median(ms):>9.1f}{percentile(ms, 99):>9.1f}"
+            f"{max(ms):>9.1f}{statuses.get(503, 0):>7}{statuses.get('error', 0):>8}{threads:>9}"
+        )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""
+Cold start time of the 'sl' command line per command, and of loading streamledge_server.
+
+Every command runs --runs times in a fresh interpreter ('python -m streamledge ...') with a throwaway config folder.
+A socket listens on the configured port so no streamledge_server gets started and the commands only print their URL.
+The script reports wall time (min/p50) with the config snapshot written next to config.ini, the p50 without it
+(the snapshot is deleted before every run, so the config is validated and the browser and screen are detected again)
+and, from one extra 'python -X importtime' run per command, the total import time and the slowest imports.
+
+By default the config leaves the window position and browser path to be detected, as a fresh config.ini does;
+--fixed-desktop sets them in config.ini instead.
+
+The common launches (--yt/--live/--kick) skip argparse; the script also checks that they parse exactly like the full parser.
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 50 --top 15
+"""
+import argparse
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_routes import SRC_DIR, write_config
+
+SL = ['-m', 'streamledge']
+# command name -> python arguments
+COMMANDS = {
+    'yt': SL + ['--yt', 'dQw4w9WgXcQ', '--url-only'],
+    'live': SL + ['--live', 'somechannel', '--url-only'],
+    'kick': SL + ['--kick', 'somechannel', '--url-only'],
+    'vod (full parser)': SL + ['--vod', 'somechannel', '--url-only'],
+    'help': SL + ['--help'],
+    'server import': ['-c', 'import streamledge_server.main'],
+}
+
+def run_command(argv, env, importtime=False, snapshot_path=None):
+    """Run 'python argv' (after deleting snapshot_path, if given), returns (seconds, stderr)"""
+    if snapshot_path and os.path.exists(snapshot_path):
+        os.remove(snapshot_path)
+    command = [sys.executable] + (['-X', 'importtime'] if importtime else []) + argv
+    start = time.perf_counter()
+    result = subprocess.run(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        sys.exit(f"'python {' '.join(argv)}' failed:\n{result.stderr}")
+    return elapsed, result.stderr
+
+def parse_importtime(stderr):
+    """(total import microseconds, [(self microseconds, module)]) from -X importtime output"""
+    total, modules = 0, []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        if not name.startswith('  '):  # top level import, its cumulative time covers everything it imported
+            total += int(cumulative_us)
+        modules.append((int(self_us), name.strip()))
+    return total, sorted(modules, reverse=True)
+
+def check_fast_path(argv):
+    """The fast path parses argv exactly like the full argparse parser does"""
+    import streamledge.main as client
+
+    argv = argv[len(SL):]
+    fast = client.parse_common_args(argv)
+    if fast is None:
+        return 'full parser'
+    saved_argv = sys.argv
+    sys.argv = ['sl'] + argv
+    try:
+        full = client.parse_all_args()
+    finally:
+        sys.argv = saved_argv
+    if vars(fast) != vars(full):
+        sys.exit(f"fast path parses 'sl {' '.join(argv)}' differently:\n  fast {vars(fast)}\n  full {vars(full)}")
+    return 'fast path'
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=20, help="timed runs per command")
+    parser.add_argument('--top', type=int, default=8, help="slowest imports to list per command")
+    parser.add_argument('--fixed-desktop', action='store_true', help="set window position and browser path in config.ini")
+    parser.add_argument('--commands', default=','.join(COMMANDS), help="comma separated commands: " + ', '.join(COMMANDS))
+    args = parser.parse_args()
+
+    config_dir = tempfile.mkdtemp(prefix='streamledge-bench-')
+    os.environ['XDG_CONFIG_HOME'] = config_dir
+    listener = socket.socket()
+    listener.bind(('127.0.0.1', 0))
+    listener.listen()
+    write_config(config_dir, detect_desktop=not args.fixed_desktop, port=listener.getsockname()[1])
+    from streamledge import config_utils
+    snapshot_path = config_utils.get_config_snapshot_path(os.path.join(config_dir, 'streamledge', 'config.ini'))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [SRC_DIR, os.environ.get('PYTHONPATH')])))
+
+    try:
+        run_command(COMMANDS['yt'], env)  # compile .pyc files and fill the version cache outside the timings
+        print(f"{args.runs} runs per command")
+        print(f"{'command':<20}{'path':>12}{'min ms':>9}{'p50 ms':>9}{'no snapshot':>13}{'imports ms':>12}")
+        slowest = {}
+        for name in args.commands.split(','):
+            argv = COMMANDS[name]
+            path = check_fast_path(argv) if argv[:len(SL)] == SL and name != 'help' else ''
+            no_snapshot = [run_command(argv, env, snapshot_path=snapshot_path)[0] * 1000 for _ in range(args.runs)]
+            timings = [run_command(argv, env)[0] * 1000 for _ in range(args.runs)]
+            total_us, modules = parse_importtime(run_command(argv, env, importtime=True)[1])
+            slowest[name] = modules[:args.top]
+            print(f"{name:<20}{path:>12}{min(timings):>9.1f}{statistics.median(timings):>9.1f}{statistics.median(no_snapshot):>13.1f}{total_us / 1000:>12.1f}")
+
+        for name, modules in slowest.items():
+            print(f"\nslowest imports (self time) for {name}: " + ', '.join(f"{module} {us / 1000:.1f} ms" for us, module in modules))
+    finally:
+        listener.close()
+        shutil.rmtree(config_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
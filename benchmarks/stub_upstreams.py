@@ -0,0 +1,289 @@
+"""
+Local stand-ins for every upstream service streamledge_server talks to, so routes can be benchmarked offline.
+
+One HTTP server answers for all hosts. streamledge_server sends its upstream requests here when started with
+STREAMLEDGE_UPSTREAM_BASE_URL set, which maps https://<host>/<path> to <base>/<host>/<path>:
+
+    www.youtube.com   /oembed, /watch, /results (videos and playlists), /playlist, POST /youtubei/v1/browse
+    gql.twitch.tv     POST /gql: user, VOD list, clip, VOD info and PlaybackAccessToken queries
+    usher.ttvnw.net   /api/channel/hls/<channel>.m3u8, /vod/<id>
+    kick.com          /api/v2/channels/<user>, /api/v2/channels/<user>/videos/latest
+
+Responses carry just the structure the server's parsers read, with names and titles derived from the requested
+IDs. Every response is delayed by --latency (+/- --jitter) seconds, and --failure-rate of requests fail
+with the --failure-mode of choice. Lookups for names starting with 'missing' answer like a nonexistent user/video.
+
+    python benchmarks/stub_upstreams.py --port 8099 --latency 0.08 --failure-rate 0.02
+    STREAMLEDGE_UPSTREAM_BASE_URL=http://127.0.0.1:8099 streamledge_server
+"""
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+FAILURE_MODES = ('500', '429', 'reset')
+PLAYLIST_PAGE_SIZE = 100  # videos per playlist page and per browse continuation, like YouTube
+
+def video_id(n):
+    return f"v{n:010d}"[-11:]
+
+def stable_number(text, digits):
+    return zlib.crc32(text.encode('utf-8')) % 10**digits
+
+def youtube_page(variable, data):
+    # compact like YouTube's own markup, some fallbacks match the raw JSON text
+    return f"<html><head><title>YouTube</title></head><body><script>var {variable} = {json.dumps(data, separators=(',', ':'))};</script></body></html>"
+
+def playlist_batch(playlist_id, start, total):
+    """playlistVideoRenderer items from `start`, followed by a continuation item if the playlist goes on"""
+    end = min(start + PLAYLIST_PAGE_SIZE, total)
+    items = [{'playlistVideoRenderer': {'videoId': video_id(n)}} for n in range(start, end)]
+    if end < total:
+        token = f"{playlist_id}:{end}"
+        items.append({'continuationItemRenderer': {'continuationEndpoint': {'continuationCommand': {'token': token}}}})
+    return items
+
+class StubUpstreams(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address, latency=0.0, jitter=0.0, failure_rate=0.0, failure_mode='500', playlist_size=300, seed=None):
+        super().__init__(address, StubHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.failure_mode = failure_mode
+        self.playlist_size = playlist_size
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts = {}  # host -> requests answered (failures included)
+
+    def plan(self, host):
+        """(delay in seconds, whether to fail) for the next request"""
+        with self.lock:
+            self.counts[host] = self.counts.get(host, 0) + 1
+            delay = max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+            return delay, self.random.random() < self.failure_rate
+
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], ConnectionError):  # clients dropping idle keep-alive connections are expected
+            super().handle_error(request, client_address)
+
+    def reset_counts(self):
+        with self.lock:
+            counts, self.counts = self.counts, {}
+        return counts
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.dispatch('GET')
+
+    def do_POST(self):
+        self.dispatch('POST')
+
+    def dispatch(self, method):
+        parts = urlsplit(self.path)
+        host, _, path = parts.path.lstrip('/').partition('/')
+        path = '/' + path
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+
+        delay, fail = self.server.plan(host)
+        time.sleep(delay)
+        if fail:
+            return self.fail()
+
+        handler = HOSTS.get(host)
+        try:
+            status, content_type, payload = handler(self, method, path, query, body) if handler else (404, 'text/plain', 'unknown host')
+        except (ValueError, KeyError) as e:
+            status, content_type, payload = 400, 'text/plain', f"bad stub request: {e}"
+        if not isinstance(payload, str):
+            payload = json.dumps(payload)
+        self.respond(status, content_type, payload.encode('utf-8'))
+
+    def respond(self, status, content_type, data, headers=()):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def fail(self):
+        mode = self.server.failure_mode
+        if mode == 'reset':
+            self.close_connection = True  # no response at all, the client sees the connection drop
+        elif mode == '429':
+            self.respond(429, 'application/json', b'{"error":"Too Many Requests"}', [('Retry-After', '1')])
+        else:
+            self.respond(500, 'text/plain', b'stub failure')
+
+    # * YouTube * #
+
+    def youtube(self, method, path, query, body):
+        if path == '/oembed':
+            target = urlsplit(query['url'])
+            target_query = parse_qs(target.query)
+            if 'list' in target_query:
+                media_id = target_query['list'][0]
+                title = f"Stub playlist {media_id} - YouTube"
+            else:
+                media_id = target_query['v'][0]
+                title = f"Stub video {media_id}"
+            if media_id.startswith('missing'):
+                return 404, 'text/plain', 'Not Found'
+            return 200, 'application/json', {'title': title, 'author_name': 'Stub channel', 'type': 'video'}
+
+        if path == '/watch':
+            data = {'videoDetails': {'videoId': query['v'], 'title': f"Stub video {query['v']}", 'lengthSeconds': '212'}}
+            return 200, 'text/html', youtube_page('ytInitialPlayerResponse', data)
+
+        if path == '/results':
+            search = query['search_query']
+            if 'sp' in query:
+                return 200, 'text/html', youtube_page('ytInitialData', self.youtube_playlist_results(search))
+            results = [{'videoRenderer': {'videoId': video_id(n), 'title': {'runs': [{'text': f"{search} result {n}"}]}}} for n in range(20)]
+            data = {'contents': {'twoColumnSearchResultsRenderer': {'primaryContents': {'sectionListRenderer': {
+                'contents': [{'itemSectionRenderer': {'contents': results}}]}}}}}
+            return 200, 'text/html', youtube_page('ytInitialData', data)
+
+        if path == '/playlist':
+            playlist_id = query['list']
+            total = self.server.playlist_size
+            data = {
+                'metadata': {'playlistMetadataRenderer': {'title': f"Stub playlist {playlist_id}"}},
+                'header': {'playlistHeaderRenderer': {'numVideosText': {'runs': [{'text': str(total)}, {'text': ' videos'}]}}},
+                'contents': {'twoColumnBrowseResultsRenderer': {'tabs': [{'tabRenderer': {'content': {'sectionListRenderer': {
+                    'contents': [{'itemSectionRenderer': {'contents': [{'playlistVideoListRenderer': {
+                        'contents': playlist_batch(playlist_id, 0, total)}}]}}]}}}}]}},
+            }
+            return 200, 'text/html', youtube_page('ytInitialData', data)
+
+        if path == '/youtubei/v1/browse' and method == 'POST':
+            playlist_id, _, start = json.loads(body)['continuation'].rpartition(':')
+            items = playlist_batch(playlist_id, int(start), self.server.playlist_size)
+            return 200, 'application/json', {'onResponseReceivedActions': [{'appendContinuationItemsAction': {'continuationItems': items}}]}
+
+        return 404, 'text/plain', 'Not Found'
+
+    @staticmethod
+    def youtube_playlist_results(search):
+        lockups = []
+        for n in range(10):
+            playlist_id = f"PL{search.encode('utf-8').hex()}{n:032d}"[:34]
+            command = {'onTap': {'innertubeCommand': {'watchEndpoint': {'playlistId': playlist_id}}}}
+            lockups.append({'lockupViewModel': {'metadata': {'lockupMetadataViewModel': {
+                'title': {'content': f"{search} playlist {n}"},
+                'metadata': {'contentMetadataViewModel': {'metadataRows': [{'metadataParts': [
+                    {'text': {'content': 'View full playlist', 'commandRuns': [command]}}]}]}},
+            }}}})
+        return {'contents': {'twoColumnSearchResultsRenderer': {'primaryContents': {'sectionListRenderer': {
+            'contents': [{'itemSectionRenderer': {'contents': lockups}}]}}}}}
+
+    # * Twitch * #
+
+    def twitch_gql(self, method, path, query, body):
+        request = json.loads(body)
+        if request.get('operationName') == 'PlaybackAccessToken':
+            variables = request.get('variables', {})
+            name = 'videoPlaybackAccessToken' if variables.get('isVod') else 'streamPlaybackAccessToken'
+            token = {'value': json.dumps({'channel': variables.get('login'), 'vod_id': variables.get('vodID')}), 'signature': 'stub'}
+            return 200, 'application/json', {'data': {name: token}}
+
+        gql = request.get('query', '')
+        if match := re.search(r'user\(login: "([^"]*)"\)', gql):
+            login = match.group(1)
+            user = None if login.startswith('missing') else {'displayName': login.capitalize(), 'id': str(stable_number(login, 9)), 'login': login}
+            return 200, 'application/json', {'data': {'user': user}}
+        if match := re.search(r'user\(id: "([^"]*)"\)\s*\{\s*videos\(first: (\d+)', gql):
+            edges = [{'node': {'id': str(2000000000 + n)}} for n in range(int(match.group(2)))]
+            return 200, 'application/json', {'data': {'user': {'videos': {'edges': edges}}}}
+        if match := re.search(r'clip\(slug: "([^"]*)"\)', gql):
+            slug = match.group(1)
+            clip = None if slug.startswith('missing') else {
+                'title': f"Stub clip {slug}", 'broadcaster': {'displayName': 'Stubstreamer'}, 'durationSeconds': 30,
+                'viewCount': 1000, 'createdAt': '2024-01-01T00:00:00Z', 'thumbnailURL': 'https://clips-media-assets2.twitch.tv/stub.jpg',
+            }
+            return 200, 'application/json', {'data': {'clip': clip}}
+        if match := re.search(r'video\(id: "([^"]*)"\)', gql):
+            video = {'title': f"Stub VOD {match.group(1)}", 'owner': {'displayName': 'Stubstreamer', 'login': 'stubstreamer'},
+                     'lengthSeconds': 7200, 'createdAt': '2024-01-01T00:00:00Z', 'viewCount': 500}
+            return 200, 'application/json', {'data': {'video': video}}
+        return 200, 'application/json', {'errors': [{'message': 'stub does not know this query'}]}
+
+    def twitch_usher(self, method, path, query, body):
+        if not (path.startswith('/api/channel/hls/') or path.startswith('/vod/')):
+            return 404, 'text/plain', 'Not Found'
+        lines = ['#EXTM3U']
+        for name, resolution, bandwidth in (('1080p60 (source)', '1920x1080', 8000000), ('720p60', '1280x720', 3400000),
+                                            ('720p', '1280x720', 2300000), ('480p', '852x480', 1400000), ('360p', '640x360', 700000),
+                                            ('160p', '284x160', 230000)):
+            group = 'chunked' if 'source' in name else name
+            lines.append(f'#EXT-X-MEDIA:TYPE=VIDEO,GROUP-ID="{group}",NAME="{name}",AUTOSELECT=YES,DEFAULT=YES')
+            lines.append(f'#EXT-X-STREAM-INF:BANDWIDTH={bandwidth},RESOLUTION={resolution},VIDEO="{group}"')
+            lines.append(f'https://video-weaver.stub.hls.ttvnw.net/v1/playlist/{group}.m3u8')
+        return 200, 'application/vnd.apple.mpegurl', '\n'.join(lines) + '\n'
+
+    # * Kick * #
+
+    def kick(self, method, path, query, body):
+        if match := re.fullmatch(r'/api/v2/channels/([^/]+)/videos/latest', path):
+            return 200, 'application/json', {'data': {'video': {'uuid': f"00000000-0000-4000-8000-{stable_number(match.group(1), 12):012d}"}}}
+        if match := re.fullmatch(r'/api/v2/channels/([^/]+)', path):
+            username = match.group(1)
+            if username.startswith('missing'):
+                return 404, 'application/json', {'message': 'Not Found'}
+            return 200, 'application/json', {'id': 1, 'slug': username, 'user': {'username': username.capitalize(), 'id': stable_number(username, 8)}}
+        return 404, 'application/json', {'message': 'Not Found'}
+
+HOSTS = {
+    'www.youtube.com': StubHandler.youtube,
+    'gql.twitch.tv': StubHandler.twitch_gql,
+    'usher.ttvnw.net': StubHandler.twitch_usher,
+    'kick.com': StubHandler.kick,
+}
+
+def add_arguments(parser):
+    parser.add_argument('--latency', type=float, default=0.05, help="seconds before each upstream response")
+    parser.add_argument('--jitter', type=float, default=0.0, help="+/- seconds added to --latency at random")
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="fraction of upstream requests that fail")
+    parser.add_argument('--failure-mode', choices=FAILURE_MODES, default='500',
+                        help="how failing requests fail: HTTP 500, HTTP 429 with Retry-After, or a dropped connection")
+    parser.add_argument('--playlist-size', type=int, default=300, help="videos in every stub playlist")
+    parser.add_argument('--seed', type=int, default=1, help="seed for jitter and failures, for repeatable runs")
+
+def start(args, port=0):
+    """Serve stubs configured from parsed add_arguments() options on a background thread, returns the server"""
+    server = StubUpstreams(('127.0.0.1', port), args.latency, args.jitter, args.failure_rate, args.failure_mode, args.playlist_size, args.seed)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=8099)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    server = StubUpstreams(('127.0.0.1', args.port), args.latency, args.jitter, args.failure_rate, args.failure_mode, args.playlist_size, args.seed)
+    print(f"Stub upstreams on http://127.0.0.1:{args.port} - start the server with STREAMLEDGE_UPSTREAM_BASE_URL=http://127.0.0.1:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
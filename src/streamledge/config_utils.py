@@ -1,56 +1,144 @@
 import configparser
+import json
 import os
 import re
 import sys
+import threading
+import time
 from typing import List
 from platformdirs import user_config_dir
 
-try:
-    from importlib.metadata import version, PackageNotFoundError
-except Exception:
-    version = None
-    PackageNotFoundError = Exception
-
-VERSION = None
-
-# 1) try installed distribution names
-if version:
-    for pkg in ("streamledge", "streamledge_temp"):
+from streamledge.screen import DEFAULT_MONITOR, SCREEN
+
+VERSION_CACHE_NAME = "version.json"
+ENVIRONMENT_CACHE_NAME = "environment.json"
+ENVIRONMENT_PROBE_TTL = 24 * 60 * 60  # facts that can't be revalidated cheaply (titlebar height) are probed again after this long
+_version = None
+_environment = None
+_installation_key = None
+
+DISTRIBUTION_NAMES = ("streamledge", "streamledge_temp")
+
+def _distribution_metadata():
+    """
+    [path, mtime] of every installed Streamledge metadata folder (*.dist-info / *.egg-info) on sys.path.
+    The folder name carries the version and reinstalling rewrites the metadata, even for an editable install
+    whose source files are left untouched. Listing sys.path is much cheaper than importing importlib.metadata.
+    """
+    found = []
+    for entry in sys.path:
         try:
-            v = version(pkg)
-            if v:
-                VERSION = f"v{str(v).lstrip('v')}"
-                break
-        except PackageNotFoundError:
+            names = os.listdir(entry or '.')
+        except OSError:
             continue
+        for name in names:
+            base, ext = os.path.splitext(name)
+            if ext not in ('.dist-info', '.egg-info') or base.split('-')[0].lower() not in DISTRIBUTION_NAMES:
+                continue
+            path = os.path.abspath(os.path.join(entry or '.', name))
+            mtimes = []
+            for metadata_file in ('METADATA', 'PKG-INFO', ''):
+                try:
+                    mtimes.append(os.path.getmtime(os.path.join(path, metadata_file) if metadata_file else path))
+                except OSError:
+                    pass
+            found.append([path, max(mtimes, default=None)])
+    return found
+
+def installation_key():
+    """Changes whenever this Streamledge installation is replaced, reinstalled or edited, for invalidating files cached across runs"""
+    global _installation_key
+    if _installation_key is None:
+        try:
+            source_mtime = os.path.getmtime(__file__)
+        except OSError:
+            source_mtime = None
+        _installation_key = [os.path.abspath(__file__), source_mtime, _distribution_metadata()]
+    return _installation_key
+
+def _resolve_version():
+    # 1) try installed distribution names
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except Exception:
+        version = None
+        PackageNotFoundError = Exception
+    if version:
+        for pkg in DISTRIBUTION_NAMES:
+            try:
+                v = version(pkg)
+                if v:
+                    return f"v{str(v).lstrip('v')}"
+            except PackageNotFoundError:
+                continue
 
-# 2) fallback to CI/env refs like refs/tags/v1.2.3 or STREAMLEDGE_VERSION
-if VERSION is None:
+    # 2) fallback to CI/env refs like refs/tags/v1.2.3 or STREAMLEDGE_VERSION
     env_ver = os.environ.get("STREAMLEDGE_VERSION") or os.environ.get("GITHUB_REF_NAME") or os.environ.get("GITHUB_REF")
     if env_ver:
         env_ver = str(env_ver).split("/")[-1].lstrip("v")
-        VERSION = f"v{env_ver}"
+        return f"v{env_ver}"
+
+    # 3) final fallback
+    return "dev-version"
+
+def get_version():
+    """
+    Streamledge version string. Looking through the installed distributions is slow, so the result is
+    saved in the config folder and reused until this installation (or the version environment variables) change.
+    """
+    global _version
+    if _version is not None:
+        return _version
+
+    cache_path = os.path.join(CONFIG_DIR, "cache", VERSION_CACHE_NAME)
+    key = [installation_key(), [os.environ.get(name) for name in ("STREAMLEDGE_VERSION", "GITHUB_REF_NAME", "GITHUB_REF")]]
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('key') == key:
+            _version = cached['version']
+            return _version
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
 
-# 3) final fallback
-if VERSION is None:
-    VERSION = "dev-version"
+    _version = _resolve_version()
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'version': _version}, f)
+    except OSError:
+        pass
+    return _version
+
+def __getattr__(name):
+    # config_utils.VERSION is resolved on first use instead of on import
+    if name == 'VERSION':
+        return get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 WINDOWS_OS = sys.platform == "win32"
 LINUX_OS = sys.platform.startswith("linux")
 MAC_OS = sys.platform == "darwin"
 
-# import modules required for retrieving window coordinates
+# import modules required for retrieving the titlebar height (window coordinates are in streamledge.screen)
 if WINDOWS_OS:
     import ctypes
-    from ctypes import wintypes
-elif LINUX_OS:
-    import subprocess
-elif MAC_OS:
-    pass  #  ¯\_(ツ)_/¯
 
 # Default/fallback config settings
 DEFAULT_PORT = 5008
 DEFAULT_SERVER_SELF_DESTRUCT = False
+DEFAULT_SERVER_ON_DEMAND = False
+DEFAULT_SERVER_IDLE_TIMEOUT = 600
+DEFAULT_SERVER_FAST_RENDER = False
+DEFAULT_SERVER_STREAM_RESPONSE = False
+SERVER_MODES = ('development', 'production', 'async')
+DEFAULT_SERVER_MODE = 'development'
+DEFAULT_SERVER_WORKERS = 8
+DEFAULT_SERVER_REQUEST_QUEUE = 32
+DEFAULT_SERVER_CONNECTION_TIMEOUT = 5
+PROFILE_REQUESTS_MODES = ('off', 'cprofile', 'sampling')
+DEFAULT_SERVER_PROFILE_REQUESTS = 'off'
+DEFAULT_SERVER_PROFILE_KEEP = 50
 DEFAULT_DISPLAY_AREA_HEIGHT = 540
 DEFAULT_WINDOWS_TITLEBAR_HEIGHT = 30  # best guess
 DEFAULT_NON_WINDOWS_TITLEBAR_HEIGHT = 0  
@@ -103,9 +191,15 @@ else:
 if not MAC_OS:
     POS_COMMENT = """# Streamledge attempts to position the web browser window in the middle and closer to the top of your display.
 # To manually set either of the X and/or Y position(s), uncomment the x_pos and/or y_pos lines below and set desired value(s)."""
+    MONITOR_CONFIG = f"""
+# Display to position the web browser window (and Twitch chat window) on when x_pos/y_pos are not set.
+# Set to primary, a monitor number (1 = first monitor) or a monitor name (like HDMI-1 on Linux or DISPLAY2 on Windows)
+monitor = {DEFAULT_MONITOR}
+"""
 else:
     POS_COMMENT = """# You may manually set either of the X and/or Y position(s).
 # Uncomment the x_pos and/or y_pos lines below and set desired value(s). Otherwise, default values will be used."""
+    MONITOR_CONFIG = ""
 
 DEFAULT_CONFIG = f"""[Server]
 
@@ -113,9 +207,46 @@ DEFAULT_CONFIG = f"""[Server]
 port = {DEFAULT_PORT}
 
 # Have the 'streamledge_server' process automatically terminate itself after serving content.
+# When no server is running, 'sl' then serves the page itself instead of starting a separate 'streamledge_server' process.
 # Set to true/false
 self_destruct = {DEFAULT_SERVER_SELF_DESTRUCT}
 
+# Have 'sl' open the server port itself and hand it to the 'streamledge_server' it starts, so the web browser can be opened right away
+# while the server is still starting up (not on Windows). A server started this way (or by a systemd-style socket activator)
+# terminates itself after 'idle_timeout' seconds without requests, the next 'sl' starts it again.
+# Set to true/false
+on_demand = {DEFAULT_SERVER_ON_DEMAND}
+idle_timeout = {DEFAULT_SERVER_IDLE_TIMEOUT}
+
+# Open the player window right away and fill in the window title once it has been looked up (YouTube videos/Mixes and Twitch clips).
+# Ignored when 'self_destruct' is enabled.
+# Set to true/false
+fast_render = {DEFAULT_SERVER_FAST_RENDER}
+
+# Send the start of the player page (with connection hints for the video site) before the video details have been looked up,
+# so the web browser can connect to the video site in the meantime. The player window shows the lookup progress until the player is ready.
+# Set to true/false
+stream_response = {DEFAULT_SERVER_STREAM_RESPONSE}
+
+# Web server used by 'streamledge_server'. 'development' is Flask's built-in server (one new thread per connection).
+# 'production' handles requests on a fixed pool of 'workers' threads. Up to 'request_queue' connections wait for a free worker,
+# further connections are turned away with '503 Service Unavailable' until the server catches up.
+# 'async' runs all video lookups on a single thread with non-blocking network requests (for many simultaneous launches).
+# A client that stalls for 'connection_timeout' seconds while sending a request or reading the response is disconnected.
+# Set to development/production/async
+server_mode = {DEFAULT_SERVER_MODE}
+workers = {DEFAULT_SERVER_WORKERS}
+request_queue = {DEFAULT_SERVER_REQUEST_QUEUE}
+connection_timeout = {DEFAULT_SERVER_CONNECTION_TIMEOUT}
+
+# Profile every request handled by 'streamledge_server' (for finding slow code, this slows the server down).
+# 'cprofile' writes a .pstats file per request, 'sampling' writes flamegraph-ready collapsed stacks (.collapsed).
+# Profiles are saved in the 'logs/profiles' folder of the Streamledge config folder, only the newest 'profile_keep' are kept.
+# Not applied to the video lookups of 'server_mode = async'. Restart the server after changing this.
+# Set to off/cprofile/sampling
+profile_requests = {DEFAULT_SERVER_PROFILE_REQUESTS}
+profile_keep = {DEFAULT_SERVER_PROFILE_KEEP}
+
 [Browser]
 
 # Display area HEIGHT of the web browser window.
@@ -126,6 +257,7 @@ display_area_height = {DEFAULT_DISPLAY_AREA_HEIGHT}
 # Override with --x [num]  and/or  --y [num]
 # x_pos = {DEFAULT_X_POS}
 # y_pos = {DEFAULT_Y_POS}
+{MONITOR_CONFIG}
 
 # Streamledge searches your system for a suitable default chromium based web browser in order of preference:  MS Edge > Chrome > Chromium
 # Optionally specify path to compatible chromium based web browser executable file by uncommenting the 'browser_path = ' line below.
@@ -307,31 +439,13 @@ def is_true(value):
     value = str(value).strip().lower()
     return value in ('true', '1')
 
-def get_window_position(height, width, default_x_pos=DEFAULT_X_POS, default_y_pos=DEFAULT_Y_POS, center_x=False, center_y=False):
-    try:
-        if center_x or center_y:
-            if WINDOWS_OS:
-                user32 = ctypes.windll.user32
-                screen_width = user32.GetSystemMetrics(0)
-                screen_height = user32.GetSystemMetrics(1)
-            elif LINUX_OS:
-                try:
-                    output = subprocess.check_output(
-                        ['xrandr --current | grep " connected " | awk \'{print $4}\' | cut -d+ -f1'], 
-                        shell=True
-                    ).decode().strip()
-                    if 'x' in output:
-                        screen_width, screen_height = map(int, output.split('x'))
-                except:
-                    pass
-    
-            x_pos = max(0, round((screen_width - width) // 2)) if center_x else default_x_pos
-            y_pos = max(0, round((screen_height - height) // 4)) if center_y else default_y_pos
-
-            return x_pos, y_pos
-        
-    except Exception:
-        pass
+def get_window_position(height, width, default_x_pos=DEFAULT_X_POS, default_y_pos=DEFAULT_Y_POS, center_x=False, center_y=False, monitor=None):
+    """Window position centered on the given monitor (see ScreenGeometry.target) where requested, the defaults otherwise"""
+    if center_x or center_y:
+        centered = SCREEN.center(width, height, monitor)
+        if centered:
+            x_pos, y_pos = centered
+            return (x_pos if center_x else default_x_pos), (y_pos if center_y else default_y_pos)
 
     return default_x_pos, default_y_pos
 
@@ -396,6 +510,73 @@ def get_valid_default_web_browser():
 
     return None
 
+def get_environment_cache_path():
+    return os.path.join(CONFIG_DIR, "cache", ENVIRONMENT_CACHE_NAME)
+
+def load_environment_cache():
+    """
+    Environment probe cache: facts about this system found at config load (default browser, titlebar height),
+    saved in the config folder so they aren't searched for again on every run and server request.
+    """
+    global _environment
+    if _environment is None:
+        try:
+            with open(get_environment_cache_path(), encoding='utf-8') as f:
+                _environment = json.load(f)
+            if not isinstance(_environment, dict) or _environment.get('installation') != installation_key():
+                _environment = None
+        except (OSError, ValueError):
+            pass
+        if _environment is None:
+            _environment = {'installation': installation_key()}
+    return _environment
+
+def save_environment_cache():
+    cache_path = get_environment_cache_path()
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(load_environment_cache(), f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+def get_default_web_browser():
+    """
+    get_valid_default_web_browser(), remembered in the environment probe cache. The remembered browser is
+    revalidated with a single os.stat (same executable, same mtime); the full search only runs when that fails.
+    """
+    environment = load_environment_cache()
+    cached = environment.get('browser')
+    if cached:
+        try:
+            if os.stat(cached['path']).st_mtime_ns == cached['mtime_ns']:
+                return cached['path']
+        except (OSError, KeyError, TypeError):
+            pass
+
+    browser_path = get_valid_default_web_browser()
+    try:
+        environment['browser'] = {'path': browser_path, 'mtime_ns': os.stat(browser_path).st_mtime_ns} if browser_path else None
+    except OSError:
+        environment['browser'] = None
+    if environment['browser'] != cached:
+        save_environment_cache()
+    return browser_path
+
+def get_cached_titlebar_height():
+    """get_titlebar_height(), remembered in the environment probe cache for ENVIRONMENT_PROBE_TTL seconds"""
+    if not WINDOWS_OS:
+        return get_titlebar_height()
+    environment = load_environment_cache()
+    cached = environment.get('titlebar_height')
+    if cached and 0 <= time.time() - cached.get('probed_at', 0) < ENVIRONMENT_PROBE_TTL:
+        return cached['value']
+    environment['titlebar_height'] = {'value': get_titlebar_height(), 'probed_at': time.time()}
+    save_environment_cache()
+    return environment['titlebar_height']['value']
+
 def is_valid_language_format(lang_code):
     pattern = r'^[a-zA-Z]{2,3}(-[a-zA-Z]{2,4})?$'
     return bool(re.fullmatch(pattern, lang_code))
@@ -457,6 +638,50 @@ def validate_config(config):
             except configparser.NoOptionError:
                 warnings.append(f"[Server] self_destruct not specified. Defaulting to '{DEFAULT_SERVER_SELF_DESTRUCT}'")
 
+            try:
+                on_demand = config.get('Server', 'on_demand')
+                if not is_truthy_falsy(on_demand):
+                    warnings.append(f"[Server] on_demand = '{on_demand}' is not a valid boolean value. Use 'true'/'false'. Using default of '{DEFAULT_SERVER_ON_DEMAND}'")
+            except configparser.NoOptionError:
+                pass
+
+            try:
+                fast_render = config.get('Server', 'fast_render')
+                if not is_truthy_falsy(fast_render):
+                    warnings.append(f"[Server] fast_render = '{fast_render}' is not a valid boolean value. Use 'true'/'false'. Using default of '{DEFAULT_SERVER_FAST_RENDER}'")
+            except configparser.NoOptionError:
+                pass
+
+            try:
+                stream_response = config.get('Server', 'stream_response')
+                if not is_truthy_falsy(stream_response):
+                    warnings.append(f"[Server] stream_response = '{stream_response}' is not a valid boolean value. Use 'true'/'false'. Using default of '{DEFAULT_SERVER_STREAM_RESPONSE}'")
+            except configparser.NoOptionError:
+                pass
+
+            try:
+                server_mode = config.get('Server', 'server_mode').strip().lower()
+                if server_mode not in SERVER_MODES:
+                    warnings.append(f"[Server] server_mode = '{server_mode}' is not valid. Valid options are {', '.join(SERVER_MODES)}. Using default of '{DEFAULT_SERVER_MODE}'")
+            except configparser.NoOptionError:
+                pass
+
+            try:
+                profile_requests = config.get('Server', 'profile_requests').strip().lower()
+                if profile_requests not in PROFILE_REQUESTS_MODES:
+                    warnings.append(f"[Server] profile_requests = '{profile_requests}' is not valid. Valid options are {', '.join(PROFILE_REQUESTS_MODES)}. Using default of '{DEFAULT_SERVER_PROFILE_REQUESTS}'")
+            except configparser.NoOptionError:
+                pass
+
+            for key, default in (('workers', DEFAULT_SERVER_WORKERS), ('request_queue', DEFAULT_SERVER_REQUEST_QUEUE), ('connection_timeout', DEFAULT_SERVER_CONNECTION_TIMEOUT), ('profile_keep', DEFAULT_SERVER_PROFILE_KEEP), ('idle_timeout', DEFAULT_SERVER_IDLE_TIMEOUT)):
+                try:
+                    if config.getint('Server', key) < 1:
+                        warnings.append(f"[Server] {key} must be at least 1. Using default of '{default}'")
+                except configparser.NoOptionError:
+                    pass
+                except ValueError:
+                    warnings.append(f"[Server] {key} must be a valid integer. Using default of '{default}'")
+
     except configparser.NoSectionError:
         errors.append("Missing [Server] section in config.ini.")
     
@@ -474,25 +699,8 @@ def validate_config(config):
             except ValueError:
                 errors.append("[Browser] display_area_height must be a valid integer")
     
-            def can_get_screen_position():
-                try:
-                    if WINDOWS_OS:
-                        ctypes.windll.user32.GetSystemMetrics(0)
-                        return True
-                    elif LINUX_OS:
-                        output = subprocess.check_output(
-                            ['xrandr', '--current'],
-                            stderr=subprocess.DEVNULL
-                        ).decode()
-                        if " connected" in output:
-                            return True
-                except Exception:
-                    pass
-        
-                return False
-
             # Check for x_pos and y_pos
-            center_capable = can_get_screen_position()
+            center_capable = bool(SCREEN.monitors())
             for pos_key, default_pos in [('x_pos', DEFAULT_X_POS), ('y_pos', DEFAULT_Y_POS)]:
                 try:
                     pos_str = config.get('Browser', pos_key)
@@ -510,13 +718,19 @@ def validate_config(config):
                     if not center_capable:
                         warnings.append(f"Unable to center {pos_key} position. Please set [Browser] {pos_key}. Using default value of '{default_pos}'")
 
+            # Check monitor
+            monitor = config.get('Browser', 'monitor', fallback='').strip()
+            if monitor and center_capable and SCREEN.find(monitor) is None:
+                connected = ', '.join(f"{number} = {found.name}" for number, found in enumerate(SCREEN.monitors(), 1))
+                warnings.append(f"[Browser] monitor = '{monitor}' was not found (connected: {connected}). Using the primary monitor.")
+
             # Check browser_path if present and require it for non Windows OS
             try:
                 # Get and clean the browser path
                 browser_path = config.get('Browser', 'browser_path', fallback='').replace('"', '').strip()
                 
                 if not browser_path:
-                    valid_browser = get_valid_default_web_browser()
+                    valid_browser = get_default_web_browser()
                     if not valid_browser:
                         errors.append("No valid chromium based browsers found on system. Please specify path to one in config.ini")
                 else:
@@ -528,7 +742,7 @@ def validate_config(config):
                     elif not os.access(browser_path, os.X_OK):  # Check if executable
                         errors.append(f"[Browser] browser_path is not executable: {browser_path}")
             except configparser.NoOptionError:
-                valid_browser = get_valid_default_web_browser()
+                valid_browser = get_default_web_browser()
                 if not valid_browser:
                     errors.append("No valid chromium based browsers found on system. Please specify path to one in config.ini")
             except Exception as e:
@@ -762,14 +976,107 @@ def validate_config(config):
 
     return warnings, errors
 
+def get_config_snapshot_path(config_path):
+    return os.path.splitext(config_path)[0] + CONFIG_SNAPSHOT_SUFFIX
+
+def config_file_state(config_path):
+    """(mtime_ns, size) of a config file, None if it doesn't exist"""
+    try:
+        stat = os.stat(config_path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+def config_file_hash(config_path):
+    import hashlib
+    try:
+        with open(config_path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+def load_config_snapshot(config_path):
+    """
+    The snapshot initialize_config() saved for config_path, if config.ini and this installation are unchanged since.
+    Returns (config dict, warnings) or None.
+    """
+    state = config_file_state(config_path)
+    if state is None:
+        return None
+    cached = _config_snapshots.get(config_path)
+    if cached and cached['state'] == state:
+        snapshot = cached
+    else:
+        try:
+            with open(get_config_snapshot_path(config_path), encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(snapshot, dict) or snapshot.get('installation') != installation_key() or snapshot.get('config_dir') != CONFIG_DIR:
+            return None
+        # Same mtime and size, or the file was only touched/saved again without changes
+        if snapshot.get('state') != state and snapshot.get('sha1') != config_file_hash(config_path):
+            return None
+        snapshot['state'] = state
+        _config_snapshots[config_path] = snapshot
+
+    # The browser found (or configured) when the snapshot was taken has to still be there
+    browser_path = snapshot['config'].get('Browser', {}).get('browser_path')
+    if not browser_path or not os.path.exists(browser_path):
+        return None
+    return snapshot['config'], snapshot['warnings']
+
+def save_config_snapshot(config_path, state, config, warnings):
+    """Save the result of initialize_config() next to config.ini, state is config_file_state() from before it was read"""
+    if state is None or config_file_state(config_path) != state:
+        return  # changed while it was being read
+    snapshot = {
+        'state': state,
+        'sha1': config_file_hash(config_path),
+        'installation': installation_key(),
+        'config_dir': CONFIG_DIR,
+        'warnings': warnings,
+        'config': {section: dict(config.items(section, raw=True)) for section in config.sections()},
+    }
+    snapshot_path = get_config_snapshot_path(config_path)
+    tmp_path = f"{snapshot_path}.{os.getpid()}.{id(snapshot)}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, snapshot_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return
+    _config_snapshots[config_path] = snapshot
+
+def print_config_warnings(warnings):
+    if warnings:
+        print("\033[33mWARNINGS\033[0m found in config.ini:")
+        for warning in warnings:
+            print(f"\033[33m------->\033[0m {warning}")  # Yellow for warnings
+
 def initialize_config(config_path):
     config = configparser.ConfigParser()
+    # Unchanged config.ini: use the result of the last run instead of validating, detecting the browser and screen again
+    snapshot = load_config_snapshot(config_path)
+    if snapshot:
+        snapshot_config, warnings = snapshot
+        print_config_warnings(warnings)
+        config.read_dict(snapshot_config)
+        return config
+
+    state = config_file_state(config_path)
     if not os.path.exists(config_path):
       # print(f"Creating default config.ini at {config_path}...")
         try:
+            os.makedirs(os.path.dirname(config_path) or '.', exist_ok=True)
             with open(config_path, 'w') as f:
                 f.write(DEFAULT_CONFIG)
             config.read_string(DEFAULT_CONFIG)
+            state = config_file_state(config_path)
             print(f"Default config.ini file created at '{config_path}'.")
         except IOError as e:
             print(f"Error creating config file: {e}")
@@ -783,11 +1090,7 @@ def initialize_config(config_path):
     
     is_server = os.path.basename(sys.argv[0]).lower().startswith('streamledge_server')
     warnings, errors = validate_config(config)
-
-    if warnings:
-        print("\033[33mWARNINGS\033[0m found in config.ini:")
-        for warning in warnings:
-            print(f"\033[33m------->\033[0m {warning}")  # Yellow for warnings
+    print_config_warnings(warnings)
     
     if errors:
         print("\033[91mERRORS\033[0m found in config.ini:")
@@ -826,7 +1129,7 @@ def initialize_config(config_path):
             raise ValueError
     except (configparser.NoOptionError, ValueError):
         # Use system-detected titlebar height if missing or invalid
-        titlebar_height = get_titlebar_height()
+        titlebar_height = get_cached_titlebar_height()
         config.set('Browser', 'titlebar_height', str(titlebar_height))
     
     # Add calculated dimensions to config
@@ -843,7 +1146,8 @@ def initialize_config(config_path):
             height=height,
             width=width,
             center_x=should_center_x,
-            center_y=should_center_y
+            center_y=should_center_y,
+            monitor=config.get('Browser', 'monitor', fallback=DEFAULT_MONITOR)
         )
         
     # Update x and y positions
@@ -855,8 +1159,9 @@ def initialize_config(config_path):
         config.set('Browser', 'y_pos', str(y_pos))
         config.set('Browser', 'should_center_y_pos', 'true')
 
-    # Set browser path
-    config.set('Browser', 'browser_path', get_valid_default_web_browser())
+    # Set browser path - a configured one was checked in validate_config, otherwise detect an installed browser
+    if is_nullish(config, 'Browser', 'browser_path'):
+        config.set('Browser', 'browser_path', get_default_web_browser() or '')
 
     def set_config_bool(config, section, option, default=False):
         """Standardizes boolean config values with proper default handling"""
@@ -917,7 +1222,8 @@ def initialize_config(config_path):
             default_x_pos=DEFAULT_TWITCH_CHAT_X_POS,
             default_y_pos=DEFAULT_TWITCH_CHAT_Y_POS,
             center_x=should_center_chat_x,
-            center_y=should_center_chat_y
+            center_y=should_center_chat_y,
+            monitor=config.get('Browser', 'monitor', fallback=DEFAULT_MONITOR)
         )
 
     # Update x and y positions
@@ -929,6 +1235,7 @@ def initialize_config(config_path):
         config.set('Twitch', 'chat_y_pos', str(chat_y_pos))
         config.set('Twitch', 'should_center_chat_y_pos', 'true')
 
+    save_config_snapshot(config_path, state, config, warnings)
     return config
 
 def get_script_dir():
@@ -940,7 +1247,11 @@ def get_script_dir():
 SCRIPT_DIR = get_script_dir()
 CONFIG_DIR = user_config_dir(appname="streamledge", appauthor=False)
 CONFIG_PATH = os.path.join(CONFIG_DIR, "config.ini")
-os.makedirs(CONFIG_DIR, exist_ok=True)
+LAUNCH_LOG_PATH = os.path.join(CONFIG_DIR, "logs", "launches.jsonl")  # written by streamledge_server, read by 'sl --stats'
+SERVER_READY_FD_ENV = "STREAMLEDGE_READY_FD"  # pipe the server started by 'sl' reports on once it is listening
+SERVER_LISTEN_FD_ENV = "STREAMLEDGE_LISTEN_FD"  # listening socket 'sl' hands to a server it starts on demand
+CONFIG_SNAPSHOT_SUFFIX = ".snapshot.json"  # config.ini -> config.snapshot.json, the validated config saved by initialize_config
+_config_snapshots = {}  # config path -> snapshot, so the server doesn't reload the file for every request
 
 class AppConfig:
     def __init__(self, config):
@@ -950,6 +1261,20 @@ class AppConfig:
         # Server Settings
         self.PORT = self._get_int('Server', 'port')
         self.SERVER_SELF_DESTRUCT = self._get_bool('Server', 'self_destruct')
+        self.SERVER_ON_DEMAND = self._get_bool('Server', 'on_demand', DEFAULT_SERVER_ON_DEMAND)
+        self.SERVER_IDLE_TIMEOUT = self._get_positive_int('Server', 'idle_timeout', DEFAULT_SERVER_IDLE_TIMEOUT)
+        self.SERVER_FAST_RENDER = self._get_bool('Server', 'fast_render', DEFAULT_SERVER_FAST_RENDER)
+        self.SERVER_STREAM_RESPONSE = self._get_bool('Server', 'stream_response', DEFAULT_SERVER_STREAM_RESPONSE)
+        self.SERVER_MODE = self._get_str('Server', 'server_mode', DEFAULT_SERVER_MODE).lower()
+        if self.SERVER_MODE not in SERVER_MODES:
+            self.SERVER_MODE = DEFAULT_SERVER_MODE
+        self.SERVER_WORKERS = self._get_positive_int('Server', 'workers', DEFAULT_SERVER_WORKERS)
+        self.SERVER_REQUEST_QUEUE = self._get_positive_int('Server', 'request_queue', DEFAULT_SERVER_REQUEST_QUEUE)
+        self.SERVER_CONNECTION_TIMEOUT = self._get_positive_int('Server', 'connection_timeout', DEFAULT_SERVER_CONNECTION_TIMEOUT)
+        self.SERVER_PROFILE_REQUESTS = self._get_str('Server', 'profile_requests', DEFAULT_SERVER_PROFILE_REQUESTS).lower()
+        if self.SERVER_PROFILE_REQUESTS not in PROFILE_REQUESTS_MODES:
+            self.SERVER_PROFILE_REQUESTS = DEFAULT_SERVER_PROFILE_REQUESTS
+        self.SERVER_PROFILE_KEEP = self._get_positive_int('Server', 'profile_keep', DEFAULT_SERVER_PROFILE_KEEP)
 
         # Browser Settings
         self.WINDOW_WIDTH = self._get_int('Browser', 'width')
@@ -959,6 +1284,7 @@ class AppConfig:
         self.WINDOW_Y_POS = self._get_int('Browser', 'y_pos')
         self.WINDOW_CENTER_X_POS = self._get_bool('Browser', 'should_center_x_pos')
         self.WINDOW_CENTER_Y_POS = self._get_bool('Browser', 'should_center_y_pos')
+        self.WINDOW_MONITOR = self._get_str('Browser', 'monitor', DEFAULT_MONITOR) or DEFAULT_MONITOR
         self.BROWSER_PATH = self._get_clean_path('Browser', 'browser_path')
         self.USER_DATA_DIR = self._get_clean_path('Browser', 'user_data_dir')
         self.BROWSER_ARGS = self._get_list('Browser', 'arguments')
@@ -1003,6 +1329,10 @@ class AppConfig:
         except (configparser.NoOptionError, configparser.NoSectionError, ValueError):
             return default
 
+    def _get_positive_int(self, section: str, key: str, default: int) -> int:
+        value = self._get_int(section, key, default)
+        return value if value >= 1 else default
+
     def _get_bool(self, section: str, key: str, default: bool = False) -> bool:
         val = self._get_str(section, key, str(default)).lower()
         return val in ('true', 'yes', '1', 'on')
@@ -0,0 +1,94 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+from urllib.parse import urlsplit
+
+# Record/replay of upstream HTTP responses, for benchmarking the page parsers offline with real-world payloads.
+# With STREAMLEDGE_UPSTREAM_RECORD=<dir> every response fetched from YouTube/Twitch/Kick is also saved to <dir>,
+# with STREAMLEDGE_UPSTREAM_REPLAY=<dir> responses are read from <dir> instead of being fetched.
+# Fixtures are stored per host as gzip files: one line of JSON metadata followed by the raw response body.
+RECORD_DIR = os.environ.get('STREAMLEDGE_UPSTREAM_RECORD', '')
+REPLAY_DIR = os.environ.get('STREAMLEDGE_UPSTREAM_REPLAY', '')
+
+def fixture_path(directory, method, url, kwargs):
+    """Fixture file of a request: the same method, URL, query params and JSON body always map to the same file"""
+    params = kwargs.get('params')
+    body = kwargs.get('json')
+    key = json.dumps([method.upper(), url, sorted((params or {}).items()), body], sort_keys=True, default=str)
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    parts = urlsplit(url)
+    slug = re.sub(r'[^\w-]+', '_', parts.path).strip('_')[:40] or 'root'
+    return os.path.join(directory, parts.hostname or 'unknown', f"{method.lower()}_{slug}_{digest}.gz")
+
+class FixtureResponse:
+    """The parts of a curl_cffi Response that Streamledge uses, read back from a fixture"""
+
+    def __init__(self, meta, content):
+        from curl_cffi.requests import Headers
+        self.url = meta['url']
+        self.status_code = meta['status']
+        self.reason = meta.get('reason', '')
+        self.headers = Headers(meta.get('headers', {}))
+        self.encoding = meta.get('encoding') or 'utf-8'
+        self.content = content
+
+    @property
+    def ok(self):
+        return 200 <= self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors='replace')
+
+    def json(self, **kwargs):
+        return json.loads(self.content, **kwargs)
+
+    def raise_for_status(self):
+        if not self.ok:
+            from curl_cffi.requests.exceptions import HTTPError
+            raise HTTPError(f"HTTP Error {self.status_code}: {self.reason}", 0, self)
+
+def replay(method, url, kwargs):
+    """The recorded response for a request. A request that was never recorded fails like a network error."""
+    path = fixture_path(REPLAY_DIR, method, url, kwargs)
+    try:
+        with gzip.open(path, 'rb') as f:
+            meta = json.loads(f.readline())
+            content = f.read()
+    except OSError:
+        from curl_cffi.requests.exceptions import RequestException
+        raise RequestException(f"No recorded response for {method} {url} ({path})")
+    return FixtureResponse(meta, content)
+
+def record(method, url, kwargs, response):
+    path = fixture_path(RECORD_DIR, method, url, kwargs)
+    meta = {
+        'method': method.upper(),
+        'url': url,
+        'params': kwargs.get('params'),
+        'json': kwargs.get('json'),
+        'status': response.status_code,
+        'reason': getattr(response, 'reason', ''),
+        'headers': {name: value for name, value in response.headers.items() if name.lower() in ('content-type', 'retry-after')},
+        'encoding': getattr(response, 'encoding', None),
+    }
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with gzip.open(tmp_path, 'wb') as f:
+            f.write(json.dumps(meta, default=str).encode('utf-8') + b'\n')
+            f.write(response.content)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Failed to record fixture {path}: {e}")
+
+def fetch(send, method, url, **kwargs):
+    """send(method, url, **kwargs) unless replaying, recording the response when recording"""
+    if REPLAY_DIR:
+        return replay(method, url, kwargs)
+    response = send(method, url, **kwargs)
+    if RECORD_DIR:
+        record(method, url, kwargs, response)
+    return response
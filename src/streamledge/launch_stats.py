@@ -0,0 +1,185 @@
+import json
+import math
+import os
+import re
+import time
+
+from streamledge import config_utils
+
+WINDOW_UNITS = {'m': 60, 'h': 60 * 60, 'd': 24 * 60 * 60, 'w': 7 * 24 * 60 * 60}
+DEFAULT_WINDOW = '7d'
+
+# Consecutive points of a launch; each gap between two present points is one phase of the breakdown
+LAUNCH_POINTS = (
+    ('launch', "launch"),
+    ('navigation', "browser navigation"),
+    ('request', "server request"),
+    ('response', "server response"),
+    ('page_load', "page loaded"),
+    ('iframe_load', "player frame loaded"),
+    ('player_ready', "player ready"),
+    ('playing', "playing"),
+)
+
+class Quantiles:
+    """Streaming quantile estimate in constant memory: values are counted in ~2% wide logarithmic buckets"""
+    GROWTH = 1.02
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, value):
+        value = max(value, 0.0)
+        bucket = int(math.log(value + 1, self.GROWTH))
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, q):
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen > rank:
+                return self.GROWTH ** (bucket + 0.5) - 1  # bucket midpoint
+        return None
+
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+def parse_window(text):
+    """'30m', '24h', '7d', '2w' -> seconds, 'all' -> None. Raises ValueError for anything else."""
+    text = (text or DEFAULT_WINDOW).strip().lower()
+    if text == 'all':
+        return None
+    match = re.fullmatch(r'(\d+(?:\.\d+)?)\s*([mhdw])', text)
+    if not match:
+        raise ValueError(f"Invalid time window '{text}'. Use e.g. 30m, 24h, 7d, 2w or all")
+    return float(match.group(1)) * WINDOW_UNITS[match.group(2)]
+
+def log_files(path=config_utils.LAUNCH_LOG_PATH):
+    """The launch log and its rotated backups, oldest first"""
+    backups = []
+    directory, name = os.path.split(path)
+    if os.path.isdir(directory):
+        for entry in os.listdir(directory):
+            suffix = entry[len(name) + 1:]
+            if entry.startswith(name + '.') and suffix.isdigit():
+                backups.append((int(suffix), os.path.join(directory, entry)))
+    files = [file for _, file in sorted(backups, reverse=True)]
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+def iter_records(files, since=None):
+    """Launch records from the given files, one line at a time, skipping unreadable lines and older launches"""
+    for file in files:
+        try:
+            if since is not None and os.path.getmtime(file) < since:
+                continue  # last written before the window started
+            with open(file, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(record, dict) and (since is None or record.get('ts', 0) >= since):
+                        yield record
+        except OSError as e:
+            print(f"Unable to read {file}: {e}")
+
+def launch_points(record):
+    """Milliseconds since launch of each point reached by a launch"""
+    server = record.get('server') or {}
+    client = record.get('client') or {}
+    points = {'launch': 0.0, **{name: client[name] for name in client if isinstance(client[name], (int, float))}}
+    if isinstance(server.get('received'), (int, float)):
+        points['request'] = server['received']
+        if isinstance(server.get('total'), (int, float)):
+            points['response'] = server['received'] + server['total']
+    return points
+
+class LaunchReport:
+    def __init__(self):
+        self.launches = 0
+        self.latency = {}  # (service, content) -> Quantiles of time to first playing frame
+        self.phases = {}  # phase label -> Quantiles
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.fully_cached = 0
+
+    def add(self, record):
+        self.launches += 1
+        points = launch_points(record)
+        if 'playing' in points:
+            group = (record.get('service') or '?', record.get('content') or '?')
+            self.latency.setdefault(group, Quantiles()).add(points['playing'])
+
+        previous = None
+        for name, label in LAUNCH_POINTS:
+            if name not in points:
+                continue
+            if previous is not None and points[name] >= points[previous[0]]:
+                self.phases.setdefault(f"{previous[1]} -> {label}", Quantiles()).add(points[name] - points[previous[0]])
+            previous = (name, label)
+
+        server = record.get('server') or {}
+        for phase, ms in (server.get('phases') or {}).items():
+            if isinstance(ms, (int, float)):
+                self.phases.setdefault(f"server: {phase}", Quantiles()).add(ms)
+        cache = server.get('cache') or {}
+        self.cache_hits += cache.get('hits', 0)
+        self.cache_misses += cache.get('misses', 0)
+        if 'upstream_requests' in server and not server['upstream_requests']:
+            self.fully_cached += 1
+
+    def render(self, window_text):
+        lines = []
+        played = sum(q.count for q in self.latency.values())
+        lines.append(f"Streamledge launches, {'all time' if window_text == 'all' else 'last ' + window_text}: "
+                     f"{self.launches} launches, {played} reached playback")
+        if not self.launches:
+            return '\n'.join(lines)
+
+        lines += ["", "Time to first playing frame (ms)", f"  {'SERVICE':<10}{'CONTENT':<18}{'COUNT':>7}{'P50':>9}{'P90':>9}{'P99':>9}"]
+        overall = Quantiles()
+        for (service, content), quantiles in sorted(self.latency.items()):
+            lines.append(self._latency_row(service, content, quantiles))
+            for bucket, count in quantiles.buckets.items():
+                overall.buckets[bucket] = overall.buckets.get(bucket, 0) + count
+            overall.count += quantiles.count
+            overall.total += quantiles.total
+        if len(self.latency) > 1:
+            lines.append(self._latency_row('all', '', overall))
+
+        lines += ["", "Slowest phases (ms)", f"  {'PHASE':<48}{'COUNT':>7}{'MEAN':>9}{'P90':>9}"]
+        for label, quantiles in sorted(self.phases.items(), key=lambda item: item[1].mean(), reverse=True)[:12]:
+            lines.append(f"  {label:<48}{quantiles.count:>7}{quantiles.mean():>9.0f}{quantiles.quantile(0.90):>9.0f}")
+
+        lookups = self.cache_hits + self.cache_misses
+        lines += ["", "Caches"]
+        if lookups:
+            lines.append(f"  Lookup hit rate: {self.cache_hits / lookups:.1%} ({self.cache_hits} of {lookups})")
+        lines.append(f"  Launches without upstream requests: {self.fully_cached / self.launches:.1%} ({self.fully_cached} of {self.launches})")
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _latency_row(service, content, quantiles):
+        values = ''.join(f"{quantiles.quantile(q):>9.0f}" for q in (0.50, 0.90, 0.99))
+        return f"  {service:<10}{content:<18}{quantiles.count:>7}{values}"
+
+def print_launch_stats(window_text=DEFAULT_WINDOW, path=config_utils.LAUNCH_LOG_PATH):
+    window = parse_window(window_text)
+    since = time.time() - window if window is not None else None
+    files = log_files(path)
+    if not files:
+        print(f"No launch log found at {path}. Launches are recorded by streamledge_server once a player has been opened.")
+        return
+    report = LaunchReport()
+    for record in iter_records(files, since):
+        report.add(record)
+    print(report.render(window_text.strip().lower()))
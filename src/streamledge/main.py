@@ -1,13 +1,17 @@
-import argparse
 import os
 import re
-import shutil
 import socket
 import subprocess
 import sys
 import time
+from types import SimpleNamespace
 from urllib.parse import quote, urlencode
 
+LAUNCH_TS = time.time()  # when 'sl' started, the start of a launch for the launch latency telemetry
+EMBEDDED_SERVER_TIMEOUT = 60  # how long 'sl' keeps serving with self_destruct if the browser never loads the page
+pages_opened = 0  # player/chat windows opened by this 'sl', which the embedded server waits for
+server_running = False  # a streamledge_server was already up when 'sl' started, so it can take launch hints
+
 from streamledge import config_utils
 from streamledge.config_utils import AppConfig, get_window_position, initialize_config
 
@@ -80,6 +84,13 @@ def open_browser(base_url, url_info, args, config, override_args=None):
         print(url)
         return
 
+    # Launch telemetry: the player page reports its playback milestones relative to when 'sl' was started.
+    # Launches forwarded by the server (runStreamledge) keep the launch ID the extension sent, if any.
+    if override_args is None and 'launchId=' not in url:
+        separator = "&" if "?" in url else "?"
+        import uuid
+        url += f"{separator}launchId={uuid.uuid4().hex}&launchTs={int(LAUNCH_TS * 1000)}&launchSource=cli"
+
     service = base_url_to_service(base_url)
     config_height, config_x_pos, config_y_pos = get_service_or_default_window_settings(service, config)
     height = (
@@ -110,7 +121,8 @@ def open_browser(base_url, url_info, args, config, override_args=None):
             default_x_pos=x_pos,
             default_y_pos=y_pos,
             center_x=should_center_x_pos,
-            center_y=should_center_y_pos
+            center_y=should_center_y_pos,
+            monitor=config.WINDOW_MONITOR
         )
 
     browser_flags = [
@@ -126,6 +138,8 @@ def open_browser(base_url, url_info, args, config, override_args=None):
     ]
 
     print(f"SERVING URL: {url}")
+    if override_args is None and server_running:
+        send_launch_hint(config.PORT, base_url, url_info)
 
     try:
         subprocess.Popen(
@@ -136,6 +150,22 @@ def open_browser(base_url, url_info, args, config, override_args=None):
         )
     except Exception as e:
         print(f"Failed to launch web browser: {e}")
+    else:
+        if override_args is None:
+            global pages_opened
+            pages_opened += 1
+
+def send_launch_hint(port, base_url, url_info):
+    """Have the server start looking up the page's video details while the web browser is still starting up"""
+    from streamledge_server import control
+    if control.request(port, 'prefetch', timeout=0.5, base_url=base_url, query=url_info) is not None:
+        return
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.5) as sock:
+            sock.sendall(f"GET /api/prefetch/{base_url}{url_info} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n".encode())
+            sock.recv(1024)
+    except OSError:
+        pass
 
 def just_browse(args, config, url=None):
     browser_path = args.browser_path or config.BROWSER_PATH
@@ -163,6 +193,10 @@ def just_browse(args, config, url=None):
         print(f"Failed to launch web browser: {e}")
 
 def shutdown_server(config):
+    from streamledge_server import control
+    if (control.request(config.PORT, 'shutdown') or {}).get('ok'):
+        print("✅ Server shutdown request successfully sent")
+        return True
     print("Attempting shutdown via /shutdown endpoint...")
     try:
         with socket.create_connection(("127.0.0.1", config.PORT), timeout=2) as sock:
@@ -178,17 +212,90 @@ def shutdown_server(config):
     print(f"No running streamledge_server found on port {config.PORT}")
     return False
 
+def server_command():
+    # Try to locate the installed CLI command
+    import shutil
+    server_path = shutil.which("streamledge_server")
+    if server_path:
+        return [server_path]
+    # Fallback to running as a module
+    return [sys.executable, "-m", "streamledge_server.main"]
+
+def activate_server(config):
+    """
+    [Server] on_demand: open the server port here and hand the listening socket to a streamledge_server started
+    in the background. Connections wait in the socket's queue until the server is up, so nothing waits for it here.
+    """
+    listen_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        listen_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listen_socket.bind(('127.0.0.1', config.PORT))
+        listen_socket.listen(128)
+    except OSError:
+        listen_socket.close()
+        return is_port_in_use(config.PORT)  # another 'sl' got there first
+    try:
+        subprocess.Popen(
+            server_command(),
+            start_new_session=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            pass_fds=(listen_socket.fileno(),),
+            env=dict(os.environ, **{config_utils.SERVER_LISTEN_FD_ENV: str(listen_socket.fileno())})
+        )
+    except Exception as e:
+        print(f"Failed to start streamledge_server: {e}")
+        return False
+    finally:
+        listen_socket.close()
+    print(f"streamledge_server starting on demand on port {config.PORT}")
+    return True
+
+def start_embedded_server(config):
+    """
+    [Server] self_destruct: serve the page from a thread of this process instead of starting a streamledge_server
+    that exits after one page. The port is open before this returns, so the browser's request waits in its queue
+    while the server code loads. Returns an Event that is set once the server self destructed, None if the port is taken.
+    """
+    import threading
+    listen_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        listen_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listen_socket.bind(('127.0.0.1', config.PORT))
+        listen_socket.listen(128)
+    except OSError:
+        listen_socket.close()
+        return None
+    finished = threading.Event()
+
+    def serve():
+        try:
+            from streamledge_server.main import serve_embedded
+            serve_embedded(listen_socket, on_exit=finished.set)
+        except Exception as e:
+            print(f"streamledge_server failed: {e}")
+        finally:
+            listen_socket.close()
+            finished.set()
+
+    threading.Thread(target=serve, name='streamledge_server', daemon=True).start()
+    return finished
+
+def wait_for_embedded_server(finished, config):
+    """Keep serving until the opened pages were delivered and the server self destructed"""
+    if not pages_opened:
+        return
+    if finished.wait(EMBEDDED_SERVER_TIMEOUT):
+        print("streamledge_server has self destructed")
+    else:
+        print(f"⚠️ No page was requested from port {config.PORT} within {EMBEDDED_SERVER_TIMEOUT} seconds")
+
 def start_server_process(config):
     try:
-        # Try to locate the installed CLI command
-        server_path = shutil.which("streamledge_server")
-        if server_path:
-            args = [server_path]
-        else:
-            # Fallback to running as a module
-            args = [sys.executable, "-m", "streamledge_server.main"]
+        args = server_command()
 
         # Start the process with platform-specific options
+        ready_fd = None
         if config_utils.WINDOWS_OS:
             proc = subprocess.Popen(
                 args,
@@ -197,12 +304,37 @@ def start_server_process(config):
                 stderr=subprocess.DEVNULL
             )
         else:
-            proc = subprocess.Popen(
-                args,
-                start_new_session=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
+            # The server reports on this pipe once it is listening (see streamledge_server notify_ready)
+            ready_fd, ready_write_fd = os.pipe()
+            try:
+                proc = subprocess.Popen(
+                    args,
+                    start_new_session=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    pass_fds=(ready_write_fd,),
+                    env=dict(os.environ, **{config_utils.SERVER_READY_FD_ENV: str(ready_write_fd)})
+                )
+            finally:
+                os.close(ready_write_fd)
+
+        message = f"streamledge_server started on port {config.PORT}"
+        if getattr(config, 'SERVER_SELF_DESTRUCT', False):
+            message += " and will self destruct"
+
+        if ready_fd is not None:
+            try:
+                ready = wait_for_server_ready(ready_fd, timeout=5)
+            finally:
+                os.close(ready_fd)
+            if ready:
+                print(message)
+                return True
+            if proc.poll() is not None:
+                print("streamledge_server process exited unexpectedly.")
+            else:
+                print("streamledge_server process failed to start (no ready signal).")
+            return False
 
         # Wait for server to open its port
         timeout = 5
@@ -210,9 +342,6 @@ def start_server_process(config):
         waited = 0
         while waited < timeout:
             if is_port_in_use(config.PORT):
-                message = f"streamledge_server started on port {config.PORT}"
-                if getattr(config, 'SERVER_SELF_DESTRUCT', False):
-                    message += " and will self destruct"
                 print(message)
                 return True
             if proc.poll() is not None:
@@ -228,6 +357,62 @@ def start_server_process(config):
         print(f"Failed to start streamledge_server: {e}")
         return False
 
+def wait_for_server_ready(ready_fd, timeout):
+    """Block until the server reports 'ready' on the pipe, False if it exits (closes the pipe) or times out first"""
+    import select
+    deadline = time.monotonic() + timeout
+    data = b''
+    while b'\n' not in data:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not select.select([ready_fd], [], [], remaining)[0]:
+            return False
+        chunk = os.read(ready_fd, 64)
+        if not chunk:
+            return False
+        data += chunk
+    return data.startswith(b'ready')
+
+def get_server_health(port, timeout=2):
+    """The /health of the streamledge_server on port, None if no streamledge_server answers there"""
+    from streamledge_server import control
+    stats = control.request(port, 'stats', timeout=timeout)
+    if stats and stats.get('status') == 'ok':
+        return stats
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=timeout) as sock:
+            sock.sendall(b"GET /health HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n")
+            response = b''
+            while chunk := sock.recv(4096):
+                response += chunk
+    except OSError:
+        return None
+    head, _, body = response.partition(b'\r\n\r\n')
+    if not re.match(rb'HTTP/1\.[01] 200 ', head):
+        return None
+    import json
+    try:
+        health = json.loads(body[body.find(b'{'):body.rfind(b'}') + 1])  # also works for a chunked body
+    except ValueError:
+        return None
+    return health if isinstance(health, dict) and health.get('status') == 'ok' else None
+
+def restart_stale_server(config, health):
+    """Stop a running streamledge_server of another Streamledge version, True once its port is free"""
+    print(f"streamledge_server {health.get('version')} is running, restarting it for Streamledge {config_utils.get_version()}")
+    try:
+        with socket.create_connection(("127.0.0.1", config.PORT), timeout=2) as sock:
+            sock.sendall(b"GET /shutdown HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n")
+            sock.recv(1024)
+    except OSError:
+        pass
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        if not is_port_in_use(config.PORT):
+            return True
+        time.sleep(0.05)
+    print(f"streamledge_server {health.get('version')} did not stop, using it anyway.")
+    return False
+
 def is_port_in_use(port):
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
         s.settimeout(0.1)
@@ -385,14 +570,41 @@ def _color(text, code):
         return text
     return f"{code}{text}{RESET}" if code else text
 
-def youtube_search(query, search_type="both"):
+def server_youtube_search(port, query, search_type):
+    """youtube_search() done by the streamledge_server on port (/api/search), None if it can't be asked"""
+    import http.client
+    import json
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    try:
+        connection.request("GET", "/api/search?" + urlencode({'q': query, 'type': search_type}))
+        response = connection.getresponse()
+        if response.status != 200:
+            return None
+        results = json.loads(response.read()).get('results')
+    except (OSError, ValueError, http.client.HTTPException):
+        return None
+    finally:
+        connection.close()
+    return results if isinstance(results, list) else None
+
+def youtube_search(query, search_type="both", fetch=None, map_items=map):
     """Fetch YouTube search results using ytInitialData JSON when possible.
     Returns video entries with 'duration' and playlist entries with 'title' only.
-    search_type: 'video' | 'playlist' | 'both'."""
+    search_type: 'video' | 'playlist' | 'both'.
+    fetch(method, url, **kwargs) replaces the default curl_cffi requests (streamledge_server passes its own sessions),
+    map_items(function, items) runs the per-result oEmbed/playlist lookups and may run them concurrently."""
     from urllib.parse import quote_plus
     import json
     import html
     import re
+    from streamledge import fixtures
+
+    if fetch is None:
+        try:
+            from curl_cffi import requests as curl_requests
+            fetch = lambda method, url, **kwargs: fixtures.fetch(curl_requests.request, method, url, **kwargs)
+        except Exception:
+            pass  # urllib below
 
     def _find_playlist_count_from_html(page_html, plid):
         """Return integer count or None. Scans ytInitialData JSON first, then falls back to regex."""
@@ -557,8 +769,9 @@ def youtube_search(query, search_type="both"):
 
     # lazy fetch (curl-cffi preferred)
     try:
-        from curl_cffi import requests as curl_requests
-        resp = curl_requests.get(url, timeout=8)
+        if fetch is None:
+            raise ImportError("curl_cffi is not available")
+        resp = fetch('GET', url, timeout=8)
         html_text = resp.text or ""
     except Exception:
         try:
@@ -676,92 +889,71 @@ def youtube_search(query, search_type="both"):
                     break
 
     # Post-process: use oEmbed for titles only (no counts)
-    try:
-        from curl_cffi import requests as _curl_requests
-    except Exception:
-        _curl_requests = None
+    def fetch_json(url, timeout):
+        if fetch is not None:
+            r = fetch('GET', url, timeout=timeout)
+            return r.json() if getattr(r, "status_code", 0) == 200 else {}
+        from urllib.request import urlopen, Request
+        req = Request(url, headers={"User-Agent": "python"})
+        with urlopen(req, timeout=timeout) as r:
+            return json.loads(r.read().decode("utf-8", "ignore"))
 
     # Fast oEmbed for videos (only top 10) to get clean titles (oEmbed doesn't provide duration)
-    if search_type in ("video", "both"):
-        for item in [r for r in results if r['type'] == 'video'][:10]:
-            # skip if we already have a reasonable title
-            if item.get('title'):
-                continue
-            vid = item.get('id')
-            if not vid:
-                continue
-            try:
-                oembed_url = f"https://www.youtube.com/oembed?url=https://www.youtube.com/watch?v={vid}&format=json"
-                if _curl_requests is not None:
-                    resp = _curl_requests.get(oembed_url, timeout=3)
-                    if getattr(resp, "status_code", 0) == 200:
-                        j = resp.json()
-                        if j.get("title"):
-                            item['title'] = html.unescape(j.get("title"))
-                        if j.get("author_name"):
-                            item['uploader'] = html.unescape(j.get("author_name"))
-                else:
-                    from urllib.request import urlopen, Request
-                    req = Request(oembed_url, headers={"User-Agent": "python"})
-                    with urlopen(req, timeout=3) as r:
-                        import json as _json
-                        j = _json.loads(r.read().decode("utf-8", "ignore"))
-                        if j.get("title"):
-                            item['title'] = html.unescape(j.get("title"))
-                        if j.get("author_name"):
-                            item['uploader'] = html.unescape(j.get("author_name"))
-            except Exception:
-                continue
+    def fix_video(item):
+        # skip if we already have a reasonable title
+        if item.get('title'):
+            return
+        vid = item.get('id')
+        if not vid:
+            return
+        try:
+            j = fetch_json(f"https://www.youtube.com/oembed?url=https://www.youtube.com/watch?v={vid}&format=json", timeout=3)
+            if j.get("title"):
+                item['title'] = html.unescape(j.get("title"))
+            if j.get("author_name"):
+                item['uploader'] = html.unescape(j.get("author_name"))
+        except Exception:
+            pass
 
     # For playlists: only use oEmbed for title/uploader fallback (no counts previously)
+    def fix_playlist(item):
+        plid = item.get('id')
+        if not plid:
+            return
+        # oEmbed for title/uploader (no auth needed)
+        try:
+            j = fetch_json(f"https://www.youtube.com/oembed?url=https://www.youtube.com/playlist?list={plid}&format=json", timeout=3)
+            if j.get("title"):
+                item['title'] = html.unescape(j.get("title").strip())
+            if j.get("author_name"):
+                item['uploader'] = html.unescape(j.get("author_name"))
+        except Exception:
+            pass
+
+        # Try lightweight playlist page fetch for count (top 10 only)
+        try:
+            page_url = f"https://www.youtube.com/playlist?list={plid}"
+            page_html = ""
+            if fetch is not None:
+                p = fetch('GET', page_url, timeout=6)
+                page_html = p.text or ""
+            else:
+                from urllib.request import urlopen, Request
+                req = Request(page_url, headers={"User-Agent": "python"})
+                with urlopen(req, timeout=6) as ph:
+                    page_html = ph.read().decode("utf-8", "ignore")
+            if page_html:
+                cnt = _find_playlist_count_from_html(page_html, plid)
+                if isinstance(cnt, int) and cnt >= 1:
+                    item['count'] = cnt
+        except Exception:
+            pass
+
+    if search_type in ("video", "both"):
+        list(map_items(fix_video, [r for r in results if r['type'] == 'video'][:10]))
     if search_type in ("playlist", "both"):
         to_fix = [r for r in results if r['type'] == 'playlist' and (not r.get('title') or not r.get('uploader') or not isinstance(r.get('count'), int))][:10]
-        for item in to_fix:
-            plid = item.get('id')
-            if not plid:
-                continue
-            # oEmbed for title/uploader (no auth needed)
-            try:
-                oembed_url = f"https://www.youtube.com/oembed?url=https://www.youtube.com/playlist?list={plid}&format=json"
-                if _curl_requests is not None:
-                    r = _curl_requests.get(oembed_url, timeout=3)
-                    if getattr(r, "status_code", 0) == 200:
-                        j = r.json()
-                        if j.get("title"):
-                            item['title'] = html.unescape(j.get("title").strip())
-                        if j.get("author_name"):
-                            item['uploader'] = html.unescape(j.get("author_name"))
-                else:
-                    from urllib.request import urlopen, Request
-                    req = Request(oembed_url, headers={"User-Agent": "python"})
-                    with urlopen(req, timeout=3) as ph:
-                        import json as _json
-                        j = _json.loads(ph.read().decode("utf-8", "ignore"))
-                        if j.get("title"):
-                            item['title'] = html.unescape(j.get("title").strip())
-                        if j.get("author_name"):
-                            item['uploader'] = html.unescape(j.get("author_name"))
-            except Exception:
-                pass
-
-            # Try lightweight playlist page fetch for count (top 10 only)
-            try:
-                page_url = f"https://www.youtube.com/playlist?list={plid}"
-                page_html = ""
-                if _curl_requests is not None:
-                    p = _curl_requests.get(page_url, timeout=6)
-                    page_html = p.text or ""
-                else:
-                    from urllib.request import urlopen, Request
-                    req = Request(page_url, headers={"User-Agent": "python"})
-                    with urlopen(req, timeout=6) as ph:
-                        page_html = ph.read().decode("utf-8", "ignore")
-                if page_html:
-                    cnt = _find_playlist_count_from_html(page_html, plid)
-                    if isinstance(cnt, int) and cnt >= 1:
-                        item['count'] = cnt
-            except Exception:
-                pass
+        list(map_items(fix_playlist, to_fix))
 
     return results
 
@@ -889,7 +1081,8 @@ def twitch_open_chat(query_string, args, config, override_args=None):
             default_x_pos=x_pos,
             default_y_pos=y_pos,
             center_x=should_center_x_pos,
-            center_y=should_center_y_pos
+            center_y=should_center_y_pos,
+            monitor=config.WINDOW_MONITOR
         )
     browser_flags = [
         browser_path,
@@ -912,6 +1105,10 @@ def twitch_open_chat(query_string, args, config, override_args=None):
         )
     except Exception as e:
         print(f"Failed to launch web browser: {e}")
+    else:
+        if override_args is None:
+            global pages_opened
+            pages_opened += 1
 
 def twitch_build_url(channel_or_vodid, content_type, args, start_time=None):
     params = []
@@ -987,8 +1184,46 @@ def kick_extract_username(input_str):
             return username
     return None
 
-def main():
-    parser = argparse.ArgumentParser(description=f'Streamledge {config_utils.VERSION}')
+# Every 'sl' option as parse_all_args() returns it when the option isn't given
+ARG_DEFAULTS = {
+    'start': False, 'stop': False, 'config': None, 'height': None, 'x': None, 'y': None, 'browser_path': None,
+    'data_dir': None, 'muted': None, 'url_only': False,
+    'yt': None, 'ytpl': None, 'ytsearch': None, 'ytplsearch': None, 'ytmix': None, 'autoplay': None, 'autoclose': None,
+    **({'fullscreen': None} if config_utils.WINDOWS_OS else {}),
+    'shuffle': None, 'loop': None, 'cc': None, 'video_controls': None, 'keyboard': None, 'fsbutton': None,
+    'vidstart': None, 'plstart': None,
+    'live': None, 'vod': None, 'vodid': None, 'clip': None, 'chat': None, 'volume': None, 'extensions': None,
+    'quality': None, 'vodstart': None,
+    'kick': None, 'kickvod': None,
+    'browse': None, 'appdata': False, 'stats': None,
+}
+# Launch commands parse_common_args() handles, and the option each one sets
+FAST_PATH_OPTIONS = {'--yt': 'yt', '--live': 'live', '--twitch': 'live', '--kick': 'kick'}
+
+def parse_common_args(argv):
+    """
+    Parse the most common launches ('sl --yt|--live|--twitch|--kick ENTRY... [--url-only]') without building
+    the full argparse parser. Returns None for anything else, which is then left to parse_all_args().
+    """
+    tokens = list(argv)
+    url_only = False
+    if tokens and tokens[0] == '--url-only':
+        url_only = True
+        tokens.pop(0)
+    elif tokens and tokens[-1] == '--url-only':
+        url_only = True
+        tokens.pop()
+    if len(tokens) < 2 or tokens[0] not in FAST_PATH_OPTIONS:
+        return None
+    entries = tokens[1:]
+    if any(entry.startswith('-') for entry in entries):
+        return None
+    return SimpleNamespace(**dict(ARG_DEFAULTS, url_only=url_only, **{FAST_PATH_OPTIONS[tokens[0]]: entries}))
+
+def parse_all_args():
+    import argparse
+
+    parser = argparse.ArgumentParser(description=f'Streamledge {config_utils.get_version()}')
     main_exclusive = parser.add_mutually_exclusive_group()
     main_exclusive.add_argument('--start', action='store_true', help='Start streamledge_server background process (NOT STRICTLY REQUIRED - happens automatically if needed)')
     main_exclusive.add_argument('--stop', action='store_true', help='Close streamledge_server background process')
@@ -1210,6 +1445,8 @@ def main():
     misc_exclusive.add_argument('--browse', metavar='URL', nargs='?', const=True,
                    help='Open browser normally (with optional URL). Install extensions, log in to Twitch, etc.')
     misc_exclusive.add_argument('--appdata', action='store_true', help='Open Streamledge appdata directory in file explorer')
+    misc_exclusive.add_argument('--stats', metavar='WINDOW', nargs='?', const='7d',
+                   help='Show launch latency statistics for the last WINDOW (e.g. 24h, 7d, all; default: 7d)')
 
     args = parser.parse_args()
     if len(sys.argv) == 1:
@@ -1224,10 +1461,24 @@ def main():
                         bool(args.live or args.vod or args.vodid or args.clip or args.chat),
                         bool(args.kick or args.kickvod),
                         bool(args.yt or args.ytpl or args.ytmix or args.ytsearch or args.ytplsearch),
-                        bool(args.browse or args.appdata)])
+                        bool(args.browse or args.appdata or args.stats)])
     if platform_args > 1:
         parser.error("Cannot combine platforms (Twitch/YouTube/Kick/Misc). Choose one.")
 
+    if args.stats:
+        from streamledge.launch_stats import print_launch_stats
+        try:
+            print_launch_stats(args.stats)
+        except ValueError as e:
+            parser.error(str(e))
+        sys.exit(0)
+
+    return args
+
+def main():
+    global server_running
+    args = parse_common_args(sys.argv[1:]) or parse_all_args()
+
     default_config_exists = os.path.exists(config_utils.CONFIG_PATH)
     using_custom_config = bool(args.config)
 
@@ -1239,6 +1490,7 @@ def main():
 
     if args.appdata:
         appdata_dir = config_utils.CONFIG_DIR
+        os.makedirs(appdata_dir, exist_ok=True)
         print(f"Opening appdata directory: {appdata_dir}")
         try:
             if config_utils.WINDOWS_OS:
@@ -1260,8 +1512,20 @@ def main():
         shutdown_server(config)
         sys.exit(0)
 
-    if not is_port_in_use(config.PORT):
-        start_server_process(config)
+    health = get_server_health(config.PORT)
+    if health and health.get('version') != config_utils.get_version() and restart_stale_server(config, health):
+        health = None
+    server_running = health is not None
+    embedded_server = None
+    if health is None and not is_port_in_use(config.PORT):
+        if config.SERVER_SELF_DESTRUCT and not args.start and not args.url_only:
+            embedded_server = start_embedded_server(config)
+        if embedded_server is not None:
+            print(f"streamledge_server serving on port {config.PORT} and will self destruct")
+        elif config.SERVER_ON_DEMAND and not config_utils.WINDOWS_OS:
+            activate_server(config)
+        else:
+            start_server_process(config)
     elif args.start:
         print(f"Port {config.PORT} is in use. Server will not start.")
         sys.exit(0)
@@ -1313,7 +1577,9 @@ def main():
         parts = args.ytsearch
         query = " ".join(parts)
         print(f"Searching YouTube for: {query}")
-        results = youtube_search(query, search_type="video")
+        results = server_youtube_search(config.PORT, query, "video") if embedded_server is None else None
+        if results is None:
+            results = youtube_search(query, search_type="video")
         vids = [r for r in results if r['type'] == 'video']
         if not vids:
             print("No video results found.")
@@ -1347,7 +1613,6 @@ def main():
             chosen = vids[idx - 1]
             print(f"Opening: {chosen['title']}")
             open_browser('youtube', f"?id={(youtube_build_url(chosen['id'], args, 0))}", args, config)
-            sys.exit(0)
         else:
             print("Selection out of range.")
             sys.exit(1)
@@ -1355,7 +1620,9 @@ def main():
         parts = args.ytplsearch
         query = " ".join(parts)
         print(f"Searching YouTube for playlists: {query}")
-        results = youtube_search(query, search_type="playlist")
+        results = server_youtube_search(config.PORT, query, "playlist") if embedded_server is None else None
+        if results is None:
+            results = youtube_search(query, search_type="playlist")
         pls = [r for r in results if r['type'] == 'playlist']
         if not pls:
             print("No playlist results found.")
@@ -1389,7 +1656,6 @@ def main():
             chosen = pls[idx - 1]
             print(f"Opening playlist: {chosen['title']}")
             open_browser('youtube', f"?id={(youtube_build_url(chosen['id'], args))}", args, config)
-            sys.exit(0)
         else:
             print("Selection out of range.")
     elif args.ytmix:
@@ -1452,7 +1718,9 @@ def main():
         if not valid_entries:
             print("Error: No valid Twitch usernames found in arguments.")
 
-    if getattr(config, 'SERVER_SELF_DESTRUCT', False):
+    if embedded_server is not None:
+        wait_for_embedded_server(embedded_server, config)
+    elif getattr(config, 'SERVER_SELF_DESTRUCT', False):
         max_wait = 10
         waited = 1
         time.sleep(waited)
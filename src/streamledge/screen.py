@@ -0,0 +1,144 @@
+import re
+import subprocess
+import sys
+import threading
+import time
+
+DEFAULT_MONITOR = 'primary'
+
+# 'DP-1 connected primary 2560x1440+1920+0 (normal left inverted right x axis y axis) 597mm x 336mm'
+XRANDR_MONITOR_PATTERN = re.compile(r'^(\S+) connected (primary )?(\d+)x(\d+)([+-]\d+)([+-]\d+)', re.MULTILINE)
+
+class Monitor:
+    def __init__(self, name, x, y, width, height, primary=False):
+        self.name = name
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.primary = primary
+
+    def __repr__(self):
+        return f"Monitor({self.name!r}, {self.width}x{self.height}+{self.x}+{self.y}{', primary' if self.primary else ''})"
+
+def parse_xrandr(output):
+    """Connected (and switched on) monitors in 'xrandr --current' output"""
+    return [
+        Monitor(name, int(x), int(y), int(width), int(height), bool(primary))
+        for name, primary, width, height, x, y in XRANDR_MONITOR_PATTERN.findall(output)
+    ]
+
+def query_windows_monitors():
+    import ctypes
+    from ctypes import wintypes
+
+    class MONITORINFOEXW(ctypes.Structure):
+        _fields_ = [
+            ('cbSize', wintypes.DWORD),
+            ('rcMonitor', wintypes.RECT),
+            ('rcWork', wintypes.RECT),
+            ('dwFlags', wintypes.DWORD),
+            ('szDevice', wintypes.WCHAR * 32),
+        ]
+
+    MONITORINFOF_PRIMARY = 1
+    user32 = ctypes.windll.user32
+    monitors = []
+
+    def add_monitor(hmonitor, hdc, rect, data):
+        info = MONITORINFOEXW()
+        info.cbSize = ctypes.sizeof(MONITORINFOEXW)
+        if user32.GetMonitorInfoW(hmonitor, ctypes.byref(info)):
+            bounds = info.rcMonitor
+            monitors.append(Monitor(
+                info.szDevice.replace('\\\\.\\', ''), bounds.left, bounds.top, bounds.right - bounds.left, bounds.bottom - bounds.top,
+                bool(info.dwFlags & MONITORINFOF_PRIMARY)
+            ))
+        return True
+
+    MonitorEnumProc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HMONITOR, wintypes.HDC, ctypes.POINTER(wintypes.RECT), wintypes.LPARAM)
+    try:
+        user32.EnumDisplayMonitors(None, None, MonitorEnumProc(add_monitor), 0)
+    except (AttributeError, OSError):
+        pass
+    if not monitors:  # primary screen only
+        monitors.append(Monitor('primary', 0, 0, user32.GetSystemMetrics(0), user32.GetSystemMetrics(1), True))
+    return monitors
+
+def query_monitors():
+    """All connected monitors with their position on the desktop, [] if they can't be found"""
+    try:
+        if sys.platform == "win32":
+            return query_windows_monitors()
+        elif sys.platform.startswith("linux"):
+            output = subprocess.run(
+                ['xrandr', '--current'], capture_output=True, timeout=5
+            ).stdout.decode(errors='replace')
+            return parse_xrandr(output)
+    except Exception:
+        pass
+    return []
+
+class ScreenGeometry:
+    """
+    The connected monitors, queried on first use and then reused for the life of the process.
+    With a ttl (seconds), a list older than that is still returned but queried again in a background thread,
+    so only the first call ever waits for the query. Safe to share between threads: only one of them queries at a time.
+    """
+
+    def __init__(self, ttl=None, query=query_monitors):
+        self.ttl = ttl
+        self._query = query
+        self._monitors = None
+        self._queried_at = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    def monitors(self):
+        with self._lock:
+            if self._monitors is None:
+                self._monitors = self._query()
+                self._queried_at = time.monotonic()
+            elif self.ttl is not None and not self._refreshing and time.monotonic() - self._queried_at > self.ttl:
+                self._refreshing = True
+                threading.Thread(target=self._refresh, name='screen-geometry', daemon=True).start()
+            return self._monitors
+
+    def _refresh(self):
+        monitors = None
+        try:
+            monitors = self._query()
+        finally:
+            with self._lock:
+                if monitors is not None:
+                    self._monitors = monitors
+                    self._queried_at = time.monotonic()
+                self._refreshing = False
+
+    def find(self, monitor=None):
+        """
+        The monitor selected by 'primary' (or None/empty), a monitor number (1 = first) or a monitor name like 'HDMI-1'.
+        None if there's no such monitor.
+        """
+        monitors = self.monitors()
+        if not monitors:
+            return None
+        selected = str(monitor or DEFAULT_MONITOR).strip().lower()
+        if selected == DEFAULT_MONITOR:
+            return next((candidate for candidate in monitors if candidate.primary), monitors[0])
+        if selected.isdigit():
+            return monitors[int(selected) - 1] if 1 <= int(selected) <= len(monitors) else None
+        return next((candidate for candidate in monitors if candidate.name.lower() == selected), None)
+
+    def target(self, monitor=None):
+        """The monitor to place windows on: find(monitor), else the primary monitor. None if no monitors were found."""
+        return self.find(monitor) or self.find(DEFAULT_MONITOR)
+
+    def center(self, width, height, monitor=None):
+        """(x, y) that centers a window horizontally and places it a quarter down the target monitor, None without monitors"""
+        target = self.target(monitor)
+        if target is None:
+            return None
+        return target.x + max(0, (target.width - width) // 2), target.y + max(0, (target.height - height) // 4)
+
+SCREEN = ScreenGeometry()
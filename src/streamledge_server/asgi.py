@@ -0,0 +1,302 @@
+import asyncio
+import io
+import signal
+import sys
+from http import HTTPStatus
+from types import SimpleNamespace
+from urllib.parse import unquote
+
+from curl_cffi.requests import AsyncSession
+from werkzeug.exceptions import HTTPException
+
+from streamledge_server import upstream
+
+ASYNC_MAX_CLIENTS = 256  # concurrent upstream requests on the shared AsyncSession (curl_cffi's default is 10)
+MAX_HEADER_BYTES = 64 * 1024
+SHUTDOWN_GRACE = 10  # seconds in-flight requests get to finish on shutdown
+
+def create_asgi_app(flask_app):
+    """
+    ASGI application serving a Flask app. Views written as upstream flows (@upstream.view) run on the
+    event loop with non-blocking upstream I/O. Everything else (static files, JSON APIs, /events) goes
+    through the regular WSGI app on a worker thread. stream_response is not applied in this mode.
+    """
+    state = {'session': None}
+
+    def session():
+        if state['session'] is None:
+            state['session'] = AsyncSession(max_clients=ASYNC_MAX_CLIENTS)
+        return state['session']
+
+    async def close_session():
+        if state['session'] is not None:
+            await state['session'].close()
+            state['session'] = None
+
+    async def lifespan(receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await close_session()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def asgi_app(scope, receive, send):
+        if scope['type'] == 'lifespan':
+            return await lifespan(receive, send)
+        if scope['type'] != 'http':
+            return
+
+        body = b''
+        while True:
+            message = await receive()
+            body += message.get('body', b'')
+            if not message.get('more_body'):
+                break
+        environ = _build_environ(scope, body)
+
+        flow = None
+        try:
+            endpoint, view_args = flask_app.url_map.bind_to_environ(environ).match()
+            flow = getattr(flask_app.view_functions.get(endpoint), 'upstream_flow', None)
+        except HTTPException:
+            pass  # 404/405 etc. are rendered by the WSGI app
+
+        if flow is None:
+            await _run_wsgi(flask_app, environ, send)
+            return
+
+        with flask_app.request_context(environ):
+            try:
+                try:
+                    rv = flask_app.preprocess_request()
+                    if rv is None:
+                        rv = await upstream.run_async(flow(**view_args), session())
+                except Exception as e:
+                    rv = flask_app.handle_user_exception(e)
+                response = flask_app.finalize_request(rv)
+            except Exception as e:
+                response = flask_app.handle_exception(e)
+            data = response.get_data()
+            response.close()  # runs call_on_close callbacks (request metrics)
+            headers = [(k.lower().encode('latin-1'), v.encode('latin-1')) for k, v in response.headers.to_wsgi_list()]
+
+        await send({'type': 'http.response.start', 'status': response.status_code, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': data})
+
+    asgi_app.close_session = close_session
+    return asgi_app
+
+def _build_environ(scope, body):
+    server_name, server_port = scope.get('server') or ('127.0.0.1', 80)
+    client = scope.get('client') or ('127.0.0.1', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', ''),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': str(server_name),
+        'SERVER_PORT': str(server_port),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': client[0],
+        'REMOTE_PORT': str(client[1]),
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+    for name, value in scope.get('headers', []):
+        name = name.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if name == 'CONTENT_TYPE':
+            environ['CONTENT_TYPE'] = value
+        elif name != 'CONTENT_LENGTH':
+            key = f"HTTP_{name}"
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+async def _run_wsgi(flask_app, environ, send):
+    """Run the WSGI app on a worker thread, streaming its body back chunk by chunk"""
+    started = {}
+
+    def start_response(status, headers, exc_info=None):
+        started['status'] = int(status.split(' ', 1)[0])
+        started['headers'] = [(k.lower().encode('latin-1'), v.encode('latin-1')) for k, v in headers]
+
+    iterable = await asyncio.to_thread(flask_app, environ, start_response)
+    iterator = iter(iterable)
+    try:
+        first = await asyncio.to_thread(next, iterator, None)
+        await send({'type': 'http.response.start', 'status': started['status'], 'headers': started['headers']})
+        chunk = first
+        while chunk is not None:
+            following = await asyncio.to_thread(next, iterator, None)
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': following is not None})
+            chunk = following
+        if first is None:
+            await send({'type': 'http.response.body', 'body': b''})
+    finally:
+        if hasattr(iterable, 'close'):
+            await asyncio.to_thread(iterable.close)
+
+### * Minimal HTTP/1.1 server for running the ASGI app without extra dependencies * ###
+
+class _Connection:
+    def __init__(self, reader, writer, asgi_app, connection_timeout):
+        self.reader = reader
+        self.writer = writer
+        self.asgi_app = asgi_app
+        self.connection_timeout = connection_timeout
+        self.headers_sent = False
+        self.chunked = False
+
+    async def handle(self):
+        try:
+            scope, body = await asyncio.wait_for(self._read_request(), self.connection_timeout)
+        except (asyncio.TimeoutError, ConnectionError, ValueError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            self.writer.close()
+            return
+        received = False
+
+        async def receive():
+            nonlocal received
+            if not received:
+                received = True
+                return {'type': 'http.request', 'body': body, 'more_body': False}
+            await asyncio.Future()  # the connection is closed after one response, so nothing else arrives
+
+        try:
+            await self.asgi_app(scope, receive, self._send)
+            if not self.headers_sent:
+                await self._send({'type': 'http.response.start', 'status': 500, 'headers': []})
+                await self._send({'type': 'http.response.body', 'body': b''})
+        except ConnectionError:
+            pass
+        except Exception as e:
+            print(f"Error handling {scope['method']} {scope['path']}: {e}")
+            if not self.headers_sent:
+                try:
+                    await self._send({'type': 'http.response.start', 'status': 500, 'headers': []})
+                    await self._send({'type': 'http.response.body', 'body': b'Internal Server Error'})
+                except ConnectionError:
+                    pass
+        finally:
+            self.writer.close()
+
+    async def _read_request(self):
+        request_line = await self.reader.readuntil(b'\r\n')
+        method, target, version = request_line.decode('latin-1').rstrip('\r\n').split(' ', 2)
+        headers = []
+        size = 0
+        while True:
+            line = await self.reader.readuntil(b'\r\n')
+            size += len(line)
+            if size > MAX_HEADER_BYTES:
+                raise ValueError("Request headers too large")
+            if line == b'\r\n':
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers.append((name.strip().lower().encode('latin-1'), value.strip().encode('latin-1')))
+
+        length = int(dict(headers).get(b'content-length', b'0') or 0)
+        body = await self.reader.readexactly(length) if length else b''
+        path, _, query = target.partition('?')
+        sockname = self.writer.get_extra_info('sockname') or ('127.0.0.1', 0)
+        peername = self.writer.get_extra_info('peername') or ('127.0.0.1', 0)
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': version.split('/', 1)[-1],
+            'method': method.upper(),
+            'scheme': 'http',
+            'path': unquote(path),
+            'raw_path': path.encode('latin-1'),
+            'query_string': query.encode('latin-1'),
+            'root_path': '',
+            'headers': headers,
+            'client': peername[:2],
+            'server': sockname[:2],
+        }
+        return scope, body
+
+    async def _send(self, message):
+        if message['type'] == 'http.response.start':
+            status = message['status']
+            try:
+                reason = HTTPStatus(status).phrase
+            except ValueError:
+                reason = ''
+            headers = list(message.get('headers', []))
+            self.chunked = not any(name.lower() == b'content-length' for name, _ in headers)
+            lines = [f"HTTP/1.1 {status} {reason}".encode('latin-1')]
+            lines += [name + b': ' + value for name, value in headers if name.lower() != b'connection']
+            if self.chunked:
+                lines.append(b'transfer-encoding: chunked')
+            lines.append(b'connection: close')
+            self.writer.write(b'\r\n'.join(lines) + b'\r\n\r\n')
+            self.headers_sent = True
+        elif message['type'] == 'http.response.body':
+            body = message.get('body', b'')
+            more_body = message.get('more_body', False)
+            if self.chunked:
+                if body:
+                    self.writer.write(f"{len(body):x}\r\n".encode() + body + b'\r\n')
+                if not more_body:
+                    self.writer.write(b'0\r\n\r\n')
+            elif body:
+                self.writer.write(body)
+            await self.writer.drain()
+
+async def serve_async(asgi_app, host, port, connection_timeout=5, ready=None, sock=None):
+    """
+    Serve `asgi_app` until cancelled or SIGINT/SIGTERM, then let in-flight requests finish.
+    `ready` (an Event or anything else with a set() method) is set once the server is listening.
+    With `sock` (an already bound listening socket) host and port are ignored.
+    """
+    tasks = set()
+
+    async def on_connection(reader, writer):
+        task = asyncio.current_task()
+        tasks.add(task)
+        try:
+            await _Connection(reader, writer, asgi_app, connection_timeout).handle()
+        finally:
+            tasks.discard(task)
+
+    if sock is not None:
+        server = await asyncio.start_server(on_connection, sock=sock, limit=MAX_HEADER_BYTES, backlog=1024)
+    else:
+        server = await asyncio.start_server(on_connection, host, port, limit=MAX_HEADER_BYTES, backlog=1024)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError, ValueError):
+            pass  # Windows or not the main thread - Ctrl+C raises KeyboardInterrupt instead
+    if ready is not None:
+        ready.set()
+    try:
+        await stop.wait()
+    finally:
+        server.close()
+        if tasks:
+            await asyncio.wait(tasks, timeout=SHUTDOWN_GRACE)
+        for task in tasks:
+            task.cancel()  # e.g. /events streams still open after the grace period
+        if hasattr(asgi_app, 'close_session'):
+            await asgi_app.close_session()
+
+def serve(asgi_app, host, port, connection_timeout=5, on_ready=None, sock=None):
+    """Run serve_async() until SIGINT/SIGTERM, calling on_ready() once the server is listening"""
+    ready = SimpleNamespace(set=on_ready) if on_ready else None
+    try:
+        asyncio.run(serve_async(asgi_app, host, port, connection_timeout, ready=ready, sock=sock))
+    except KeyboardInterrupt:
+        pass
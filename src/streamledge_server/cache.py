@@ -0,0 +1,98 @@
+import threading
+import time
+from collections import OrderedDict
+
+# Every cache registers itself here so its statistics can be reported in one place
+CACHES = []
+
+# Called as observer(cache_name, hit) after every lookup, on the looking-up thread (e.g. per-launch hit counts)
+LOOKUP_OBSERVERS = []
+
+def notify_lookup(name, hit):
+    for observer in LOOKUP_OBSERVERS:
+        observer(name, hit)
+
+class MetadataCache:
+    """
+    Thread-safe LRU cache with an optional per-entry TTL.
+    Keeps hit/miss/eviction counters for reporting.
+    """
+
+    def __init__(self, name, maxsize=1024, ttl=None):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl  # seconds, None = entries never expire
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        CACHES.append(self)
+
+    def get(self, key, default=None):
+        hit = False
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    hit = True
+                else:
+                    del self._data[key]
+                    self.evictions += 1
+            if not hit:
+                self.misses += 1
+        notify_lookup(self.name, hit)
+        return value if hit else default
+
+    def pop(self, key, default=None):
+        """get() that also removes the entry (for values that are only good for one use)"""
+        value = self.get(key, default)
+        with self._lock:
+            self._data.pop(key, None)
+        return value
+
+    def get_many(self, keys):
+        """Returns {key: value} for every key currently cached"""
+        found = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set(self, key, value, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def __contains__(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and (entry[0] is None or entry[0] > time.monotonic())
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'name': self.name,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
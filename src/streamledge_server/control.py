@@ -0,0 +1,115 @@
+import json
+import os
+import socket
+import socketserver
+import threading
+
+from streamledge import config_utils
+
+# Local control channel between 'sl' and streamledge_server: a Unix domain socket in the config folder, one per port.
+# Every request is one line of JSON naming an operation and its parameters, e.g. {"op": "resolve", "type": "video", "id": "..."},
+# answered with one line of JSON: {"ok": true, ...result} or {"ok": false, "error": "..."}.
+# A connection may send any number of requests. Not available on Windows, where 'sl' keeps using HTTP.
+AVAILABLE = hasattr(socket, 'AF_UNIX') and not config_utils.WINDOWS_OS
+MAX_REQUEST_SIZE = 64 * 1024
+
+def socket_path(port):
+    return os.path.join(config_utils.CONFIG_DIR, f"control-{port}.sock")
+
+class ControlError(Exception):
+    """A request that can't be carried out, answered with its message as the error"""
+
+class _ControlHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        while True:
+            line = self.rfile.readline(MAX_REQUEST_SIZE + 1)
+            if not line.strip():
+                return
+            if len(line) > MAX_REQUEST_SIZE:
+                response = {'ok': False, 'error': f"Request larger than {MAX_REQUEST_SIZE} bytes"}
+            else:
+                response = self.server.control.dispatch(line)
+            try:
+                self.wfile.write(json.dumps(response, default=str).encode('utf-8') + b'\n')
+            except OSError:
+                return
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+class ControlServer:
+    """
+    Serves the control socket from a background thread. `operations` maps operation names to functions taking the
+    request dict and returning a dict of results (or raising ControlError).
+    The socket file is only accessible to the user running the server.
+    """
+
+    def __init__(self, path, operations):
+        self.path = path
+        self.operations = operations
+        self._server = None
+
+    def dispatch(self, line):
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return {'ok': False, 'error': f"Invalid JSON: {e}"}
+        if not isinstance(request, dict) or request.get('op') not in self.operations:
+            op = request.get('op') if isinstance(request, dict) else None
+            return {'ok': False, 'error': f"Unknown operation {op!r}, expected one of: {', '.join(self.operations)}"}
+        try:
+            result = self.operations[request['op']](request)
+        except ControlError as e:
+            return {'ok': False, 'error': str(e)}
+        except Exception as e:
+            return {'ok': False, 'error': f"{request['op']} failed: {type(e).__name__}: {e}"}
+        return dict(result or {}, ok=True)
+
+    def start(self):
+        """Listen on the socket, replacing a socket file left behind by an earlier server. False if that fails."""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            old_umask = os.umask(0o177)
+            try:
+                self._server = _UnixServer(self.path, _ControlHandler)
+            finally:
+                os.umask(old_umask)
+        except OSError as e:
+            print(f"Control socket {self.path} unavailable: {e}")
+            return False
+        self._server.control = self
+        threading.Thread(target=self._server.serve_forever, args=(0.1,), name='control', daemon=True).start()
+        return True
+
+    def close(self):
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+def request(port, op, timeout=2, **params):
+    """Send one request to the server on port. The response dict, or None if no server listens on the control socket."""
+    if not AVAILABLE:
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(socket_path(port))
+            sock.sendall(json.dumps(dict(params, op=op)).encode('utf-8') + b'\n')
+            response = b''
+            while not response.endswith(b'\n'):
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                response += chunk
+        response = json.loads(response)
+    except (OSError, ValueError):
+        return None
+    return response if isinstance(response, dict) else None
@@ -0,0 +1,77 @@
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+# Milestones a player page can report, in the order they normally happen
+MILESTONES = ('navigation', 'page_load', 'iframe_load', 'player_ready', 'playing')
+MAX_LAUNCH_AGE = 120  # seconds; an older launchTs comes from a reloaded or reused URL, not a fresh launch
+
+class LaunchTracker:
+    """
+    Joins what the server knows about a player launch (service, content, server phase timings) with the
+    milestones reported by the player page, and writes one JSON record per launch to the 'launches' logger.
+    All times in a record are milliseconds since the launch started: the `sl` command or extension click
+    when the URL carries launchId/launchTs, otherwise the server receiving the request.
+    """
+
+    def __init__(self, logger_name='launches', pending_ttl=600, max_pending=256):
+        self.logger = logging.getLogger(logger_name)
+        self.pending_ttl = pending_ttl
+        self.max_pending = max_pending
+        self._pending = OrderedDict()  # launch id -> record, kept after reporting to recognise page reloads
+        self._lock = threading.Lock()
+
+    def begin(self, launch_id, launch_ts, source, received_ts, **info):
+        """Register a launch whose page is being served. Returns the (possibly new) launch id and its start time."""
+        with self._lock:
+            self._expire()
+            fresh = launch_id and launch_id not in self._pending and launch_ts and 0 <= received_ts - launch_ts <= MAX_LAUNCH_AGE * 1000
+            if not fresh:
+                launch_id, launch_ts, source = uuid.uuid4().hex, received_ts, 'direct'
+            record = {
+                'ts': round(launch_ts / 1000, 3),
+                'launch_id': launch_id,
+                'source': source,
+                **info,
+                'server': {'received': round(received_ts - launch_ts, 1)},
+                'client': {},
+                'complete': False,
+            }
+            self._pending[launch_id] = (time.monotonic(), launch_ts, record)
+            while len(self._pending) > self.max_pending:
+                self._pending.popitem(last=False)
+        return launch_id, launch_ts
+
+    def update_server(self, launch_id, **server):
+        """Add server-side results (phase timings, cache lookups) once the response has been sent"""
+        with self._lock:
+            entry = self._pending.get(launch_id)
+            if entry is not None:
+                entry[2]['server'].update(server)
+
+    def report(self, launch_id, milestones, complete):
+        """Record the milestones (epoch milliseconds) reported by the page. Each launch is written once."""
+        with self._lock:
+            entry = self._pending.get(launch_id)
+            if entry is None or entry[2] is None:
+                return None
+            registered, launch_ts, record = entry
+            self._pending[launch_id] = (registered, launch_ts, None)
+        for name in MILESTONES:
+            value = milestones.get(name) if isinstance(milestones, dict) else None
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                record['client'][name] = round(value - launch_ts, 1)
+        record['complete'] = bool(complete) and 'playing' in record['client']
+        self.logger.info(json.dumps(record, separators=(',', ':')))
+        return record
+
+    def _expire(self):
+        cutoff = time.monotonic() - self.pending_ttl
+        while self._pending:
+            launch_id, (registered, _, _) = next(iter(self._pending.items()))
+            if registered > cutoff:
+                break
+            del self._pending[launch_id]
@@ -0,0 +1,160 @@
+import cProfile
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+
+PROFILE_MODES = ('cprofile', 'sampling')
+SAMPLE_INTERVAL = 0.002  # seconds between stack samples (the GIL switch interval limits the real rate under load)
+SKIP_PREFIXES = ('/static/', '/events/', '/metrics')  # long-lived streams and scrapes are not worth profiling
+
+class _Sampler(threading.Thread):
+    """Samples the stack of one thread at a fixed interval and counts identical stacks"""
+
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL):
+        super().__init__(name='request-profiler', daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.active = threading.Event()  # only sample while the request's code is running, not the server's
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            if not self.active.is_set():
+                continue
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+    def collapsed(self):
+        """Brendan Gregg's collapsed stack format, input for flamegraph.pl / speedscope"""
+        return ''.join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+class _ProfiledResponse:
+    """Wraps a WSGI response iterable so body generation (streamed pages) is profiled as well"""
+
+    def __init__(self, profiler, environ, iterable, session):
+        self.profiler = profiler
+        self.environ = environ
+        self.iterable = iterable
+        self.iterator = None
+        self.session = session
+
+    def __iter__(self):
+        self.iterator = iter(self.session.run(iter, self.iterable))
+        return self
+
+    def __next__(self):
+        return self.session.run(next, self.iterator)
+
+    def close(self):
+        try:
+            if hasattr(self.iterable, 'close'):
+                self.session.run(self.iterable.close)
+        finally:
+            self.session.finish()
+            self.profiler.save(self.environ, self.session)
+
+class _Session:
+    """Profiling state of one request; run() executes a piece of the request with profiling switched on"""
+
+    def __init__(self, mode):
+        self.mode = mode
+        self.started = time.perf_counter()
+        self.duration = 0.0
+        if mode == 'cprofile':
+            self.profile = cProfile.Profile()
+        else:
+            self.sampler = _Sampler(threading.get_ident())
+            self.sampler.start()
+
+    def run(self, function, *args):
+        if self.mode == 'cprofile':
+            return self.profile.runcall(function, *args)
+        self.sampler.active.set()
+        try:
+            return function(*args)
+        finally:
+            self.sampler.active.clear()
+
+    def finish(self):
+        self.duration = time.perf_counter() - self.started
+        if self.mode == 'sampling':
+            self.sampler.stop()
+
+class RequestProfiler:
+    """
+    WSGI middleware that runs every request under cProfile ('cprofile', writes .pstats files) or a
+    sampling profiler ('sampling', writes flamegraph-ready .collapsed stacks) and keeps the newest
+    `keep` profiles in `output_dir`. Only one request is profiled with cProfile at a time.
+    """
+
+    def __init__(self, app, mode, output_dir, keep=50):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode '{mode}'")
+        self.app = app
+        self.mode = mode
+        self.output_dir = output_dir
+        self.keep = keep
+        self._cprofile_lock = threading.Lock()  # cProfile can't run in two threads at once on newer Pythons
+        self._save_lock = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        if environ.get('PATH_INFO', '').startswith(SKIP_PREFIXES):
+            return self.app(environ, start_response)
+        if self.mode == 'cprofile' and not self._cprofile_lock.acquire(blocking=False):
+            return self.app(environ, start_response)
+        session = None
+        try:
+            session = _Session(self.mode)
+            iterable = session.run(self.app, environ, start_response)
+        except BaseException:
+            if session is not None:
+                session.finish()
+                self.save(environ, session)
+            elif self.mode == 'cprofile':
+                self._cprofile_lock.release()
+            raise
+        return _ProfiledResponse(self, environ, iterable, session)
+
+    def save(self, environ, session):
+        if self.mode == 'cprofile':
+            self._cprofile_lock.release()
+        name = re.sub(r'[^A-Za-z0-9]+', '_', environ.get('PATH_INFO', '')).strip('_') or 'root'
+        now = time.time()
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(now)) + f"{now % 1:.3f}"[1:]
+        base = os.path.join(self.output_dir, f"{stamp}_{name}_{session.duration * 1000:.0f}ms")
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            if self.mode == 'cprofile':
+                session.profile.dump_stats(base + '.pstats')
+            else:
+                with open(base + '.collapsed', 'w', encoding='utf-8') as f:
+                    f.write(session.sampler.collapsed())
+            self._prune()
+        except OSError as e:
+            print(f"Error saving request profile: {e}")
+
+    def _prune(self):
+        with self._save_lock:
+            files = [entry for entry in os.scandir(self.output_dir) if entry.name.endswith(('.pstats', '.collapsed'))]
+            if len(files) <= self.keep:
+                return
+            files.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in files[:len(files) - self.keep]:
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
@@ -0,0 +1,88 @@
+import itertools
+import threading
+import time
+from collections import deque
+
+class _Topic:
+    def __init__(self, history):
+        self.events = deque(maxlen=history)  # (seq, event, data), replayed to late subscribers
+        self.closed = False
+        self.touched = time.monotonic()
+
+class PubSub:
+    """
+    Minimal in-process publish/subscribe keyed by topic (one topic per player launch).
+    Subscribers get the topic's recent history first, then live events until the topic is closed.
+    Topics are forgotten `expire_after` seconds after their last event.
+    """
+
+    def __init__(self, history=100, expire_after=300):
+        self.history = history
+        self.expire_after = expire_after
+        self._topics = {}
+        self._seq = itertools.count(1)
+        self._condition = threading.Condition()
+
+    def open(self, topic):
+        with self._condition:
+            self._sweep()
+            self._topics[topic] = _Topic(self.history)
+
+    def __contains__(self, topic):
+        with self._condition:
+            return topic in self._topics
+
+    def publish(self, topic, event, data=None):
+        """Publish an event to an open topic. Unknown or closed topics are ignored."""
+        with self._condition:
+            entry = self._topics.get(topic)
+            if entry is None or entry.closed:
+                return
+            entry.events.append((next(self._seq), event, data))
+            entry.touched = time.monotonic()
+            self._condition.notify_all()
+
+    def close(self, topic):
+        with self._condition:
+            entry = self._topics.get(topic)
+            if entry is not None:
+                entry.closed = True
+                entry.touched = time.monotonic()
+                self._condition.notify_all()
+
+    def subscribe(self, topic, timeout=120, heartbeat=15):
+        """
+        Generator of (event, data) tuples for a topic. Yields None every `heartbeat` seconds without events.
+        Ends once the topic is closed (after replaying everything published), is unknown, or after `timeout` seconds.
+        """
+        deadline = time.monotonic() + timeout
+        last_seq = 0
+        while True:
+            with self._condition:
+                entry = self._topics.get(topic)
+                if entry is None:
+                    return
+                pending = [item for item in entry.events if item[0] > last_seq]
+                if not pending:
+                    if entry.closed:
+                        return
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return
+                    self._condition.wait(min(heartbeat, remaining))
+                    pending = [item for item in entry.events if item[0] > last_seq]
+                closed = entry.closed
+            if not pending:
+                if closed:
+                    return
+                yield None
+                continue
+            for seq, event, data in pending:
+                last_seq = seq
+                yield event, data
+
+    def _sweep(self):
+        """Drop expired topics (caller holds the lock)"""
+        cutoff = time.monotonic() - self.expire_after
+        for topic in [t for t, entry in self._topics.items() if entry.touched < cutoff]:
+            del self._topics[topic]
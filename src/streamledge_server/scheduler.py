@@ -0,0 +1,134 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+INTERACTIVE = 0  # a user is waiting on the result (e.g. a player window asking for its title)
+BACKGROUND = 1  # prefetches, cache refreshes and warmups
+
+PRIORITY_NAMES = {INTERACTIVE: 'interactive', BACKGROUND: 'background'}
+
+class _ClassStats:
+    def __init__(self):
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.running = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.recent_waits = deque(maxlen=512)
+
+    def snapshot(self, queued):
+        waits = sorted(self.recent_waits)
+
+        def pct(p):
+            return waits[min(len(waits) - 1, int(len(waits) * p))] if waits else 0.0
+
+        started = self.completed + self.failed + self.running
+        return {
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'failed': self.failed,
+            'running': self.running,
+            'queued': queued,
+            'wait_avg': self.wait_total / started if started else 0.0,
+            'wait_p50': pct(0.50),
+            'wait_p95': pct(0.95),
+            'wait_max': self.wait_max,
+        }
+
+class PriorityScheduler:
+    """
+    Fixed pool of worker threads that always starts queued INTERACTIVE jobs before BACKGROUND jobs
+    (FIFO within a priority). At most `background_limit` BACKGROUND jobs run at once, so the
+    remaining workers are always free for interactive work. Queue wait times are recorded per priority.
+    """
+
+    def __init__(self, name, workers=6, background_limit=2):
+        if background_limit >= workers:
+            raise ValueError("background_limit must leave at least one worker for interactive jobs")
+        self.name = name
+        self.workers = workers
+        self.background_limit = background_limit
+        self._heap = []  # (priority, seq, queued_at, future, fn, args, kwargs)
+        self._seq = itertools.count()
+        self._condition = threading.Condition()
+        self._stats = {priority: _ClassStats() for priority in PRIORITY_NAMES}
+        self._shutdown = False
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"{name}-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn, *args, priority=BACKGROUND, **kwargs):
+        future = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError(f"Scheduler '{self.name}' has been shut down")
+            heapq.heappush(self._heap, (priority, next(self._seq), time.monotonic(), future, fn, args, kwargs))
+            self._stats[priority].submitted += 1
+            self._condition.notify()
+        return future
+
+    def _next_job(self):
+        """Pop the next runnable job (caller holds the lock), or None if nothing may start now"""
+        if not self._heap:
+            return None
+        if self._heap[0][0] == BACKGROUND and self._stats[BACKGROUND].running >= self.background_limit:
+            return None  # the heap top is background, so no interactive jobs are waiting either
+        return heapq.heappop(self._heap)
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                job = self._next_job()
+                while job is None:
+                    if self._shutdown and not self._heap:
+                        return
+                    self._condition.wait()
+                    job = self._next_job()
+                priority, _, queued_at, future, fn, args, kwargs = job
+                stats = self._stats[priority]
+                wait = time.monotonic() - queued_at
+                stats.wait_total += wait
+                stats.wait_max = max(stats.wait_max, wait)
+                stats.recent_waits.append(wait)
+                stats.running += 1
+
+            failed = False
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    failed = True
+                    future.set_exception(e)
+
+            with self._condition:
+                stats.running -= 1
+                if failed:
+                    stats.failed += 1
+                else:
+                    stats.completed += 1
+                self._condition.notify_all()  # a background slot may have opened up
+
+    def stats(self):
+        with self._condition:
+            queued = {priority: 0 for priority in PRIORITY_NAMES}
+            for job in self._heap:
+                queued[job[0]] += 1
+            return {
+                PRIORITY_NAMES[priority]: stats.snapshot(queued[priority])
+                for priority, stats in self._stats.items()
+            }
+
+    def shutdown(self, wait=True):
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
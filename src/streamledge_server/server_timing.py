@@ -0,0 +1,58 @@
+import time
+from contextlib import contextmanager
+
+class ServerTiming:
+    """
+    Phase timings of one request, rendered as a Server-Timing header (shown in Chromium devtools)
+    and as a compact log line. Repeated phases with the same name are added together.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = {}  # name -> [seconds, description]
+
+    def add(self, name, seconds, description=None):
+        phase = self.phases.get(name)
+        if phase is None:
+            self.phases[name] = [seconds, description]
+        else:
+            phase[0] += seconds
+
+    @contextmanager
+    def phase(self, name, description=None):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started, description)
+
+    def total(self):
+        return time.perf_counter() - self.started
+
+    def totals(self):
+        """Milliseconds per phase, numbered phases (upstream-1, upstream-2, ...) added up under their base name"""
+        totals = {}
+        for name, (seconds, _) in self.phases.items():
+            base, _, number = name.rpartition('-')
+            if not (base and number.isdigit()):
+                base = name
+            totals[base] = totals.get(base, 0.0) + seconds * 1000
+        return {name: round(ms, 1) for name, ms in totals.items()}
+
+    def header(self):
+        entries = []
+        for name, (seconds, description) in self.phases.items():
+            entry = f"{name};dur={seconds * 1000:.1f}"
+            if description:
+                entry += ';desc="' + description.replace('\\', '\\\\').replace('"', '\\"') + '"'
+            entries.append(entry)
+        entries.append(f"total;dur={self.total() * 1000:.1f}")
+        return ', '.join(entries)
+
+    def summary(self):
+        parts = [
+            f"{name}({description})={seconds * 1000:.0f}ms" if description else f"{name}={seconds * 1000:.0f}ms"
+            for name, (seconds, description) in self.phases.items()
+        ]
+        parts.append(f"total={self.total() * 1000:.0f}ms")
+        return ' '.join(parts)
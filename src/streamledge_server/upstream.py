@@ -0,0 +1,233 @@
+import asyncio
+import os
+import threading
+import time
+from functools import partial, update_wrapper
+from urllib.parse import urlsplit
+
+from curl_cffi import requests
+
+from streamledge import fixtures
+from streamledge_server.cache import notify_lookup
+from streamledge_server.metrics import REGISTRY
+
+# Upstream lookups are written once as generator "flows" that yield the I/O they need instead of doing it:
+#
+#     response = yield upstream.get(url, timeout=(3.05, 5.0))   # HTTP request, response is sent back in
+#     yield upstream.pause(2)                                     # backoff
+#     result = yield upstream.offload(blocking_function, arg)     # other blocking work (disk, subprocess)
+#     title = yield from youtube_get_video_title.flow(video_id)   # another flow
+#
+# Request exceptions are raised inside the flow at the yield, so ordinary try/except retry loops keep working.
+# run_sync() performs the steps with blocking calls (Flask server modes); run_async() awaits them on an
+# event loop with a curl_cffi AsyncSession, so many lookups can be in flight on one thread (async server mode).
+
+class Fetch:
+    __slots__ = ('method', 'url', 'kwargs')
+
+    def __init__(self, method, url, kwargs):
+        self.method = method
+        self.url = url
+        self.kwargs = kwargs
+
+class Pause:
+    __slots__ = ('seconds',)
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+class Offload:
+    __slots__ = ('function', 'args', 'kwargs')
+
+    def __init__(self, function, args, kwargs):
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+
+UPSTREAM_LATENCY = REGISTRY.histogram(
+    'streamledge_upstream_request_duration_seconds', "Upstream HTTP request latency", ('host', 'method'))
+UPSTREAM_REQUESTS = REGISTRY.counter(
+    'streamledge_upstream_requests_total', "Upstream HTTP requests by response status ('error' if none)", ('host', 'method', 'status'))
+UPSTREAM_RETRIES = REGISTRY.counter(
+    'streamledge_upstream_retries_total', "Upstream requests repeated after a backoff", ('host',))
+
+# Send every upstream request to local stand-ins instead (benchmarks/stub_upstreams.py): with
+# STREAMLEDGE_UPSTREAM_BASE_URL=http://127.0.0.1:8099, https://gql.twitch.tv/gql is fetched from http://127.0.0.1:8099/gql.twitch.tv/gql
+UPSTREAM_BASE_URL = os.environ.get('STREAMLEDGE_UPSTREAM_BASE_URL', '').rstrip('/')
+
+def target_url(url):
+    """The URL a request for `url` is actually sent to"""
+    if not UPSTREAM_BASE_URL or '://' not in url:
+        return url
+    return f"{UPSTREAM_BASE_URL}/{url.split('://', 1)[1]}"
+
+# Responses are recorded to / replayed from fixture files instead when streamledge.fixtures is enabled
+def _send(session, method, url, **kwargs):
+    return session.request(method, target_url(url), **kwargs)
+
+async def _send_async(session, method, url, kwargs):
+    if fixtures.REPLAY_DIR:
+        return fixtures.replay(method, url, kwargs)
+    response = await session.request(method, target_url(url), **kwargs)
+    if fixtures.RECORD_DIR:
+        fixtures.record(method, url, kwargs, response)
+    return response
+
+# Called as observer(host, method, seconds, status) after every upstream request, on the thread/task that made it
+FETCH_OBSERVERS = []
+
+def _record(method, url, started, response, retry):
+    seconds = time.perf_counter() - started
+    host = urlsplit(url).hostname or 'unknown'
+    status = response.status_code if response is not None else 'error'
+    UPSTREAM_LATENCY.observe(seconds, host, method)
+    UPSTREAM_REQUESTS.inc(host, method, status)
+    if retry:
+        UPSTREAM_RETRIES.inc(host)
+    for observer in FETCH_OBSERVERS:
+        observer(host, method, seconds, status)
+
+def session_request(session, method, url, retry=False, **kwargs):
+    """Blocking request on a caller's requests.Session, recorded like flow requests"""
+    started = time.perf_counter()
+    response = None
+    try:
+        response = fixtures.fetch(partial(_send, session), method, url, **kwargs)
+        return response
+    finally:
+        _record(method, url, started, response, retry)
+
+def get(url, **kwargs):
+    return Fetch('GET', url, kwargs)
+
+def post(url, **kwargs):
+    return Fetch('POST', url, kwargs)
+
+def pause(seconds):
+    return Pause(seconds)
+
+def offload(function, *args, **kwargs):
+    return Offload(function, args, kwargs)
+
+def run_sync(flow):
+    """Run a flow to completion with blocking I/O and return its result"""
+    result, error = None, None
+    backed_off = False  # a request right after a pause is a retry (flows only pause to back off)
+    try:
+        while True:
+            step = flow.throw(error) if error is not None else flow.send(result)
+            result, error = None, None
+            try:
+                if isinstance(step, Fetch):
+                    started = time.perf_counter()
+                    try:
+                        result = fixtures.fetch(partial(_send, requests), step.method, step.url, **step.kwargs)
+                    finally:
+                        _record(step.method, step.url, started, result, backed_off)
+                        backed_off = False
+                elif isinstance(step, Pause):
+                    backed_off = True
+                    time.sleep(step.seconds)
+                elif isinstance(step, Offload):
+                    result = step.function(*step.args, **step.kwargs)
+                else:
+                    raise TypeError(f"Unknown upstream step: {step!r}")
+            except Exception as e:
+                error = e
+    except StopIteration as stop:
+        return stop.value
+
+async def run_async(flow, session):
+    """Run a flow on the running event loop using `session` (curl_cffi AsyncSession) and return its result"""
+    result, error = None, None
+    backed_off = False
+    try:
+        while True:
+            step = flow.throw(error) if error is not None else flow.send(result)
+            result, error = None, None
+            try:
+                if isinstance(step, Fetch):
+                    started = time.perf_counter()
+                    try:
+                        result = await _send_async(session, step.method, step.url, step.kwargs)
+                    finally:
+                        _record(step.method, step.url, started, result, backed_off)
+                        backed_off = False
+                elif isinstance(step, Pause):
+                    backed_off = True
+                    await asyncio.sleep(step.seconds)
+                elif isinstance(step, Offload):
+                    result = await asyncio.to_thread(step.function, *step.args, **step.kwargs)
+                else:
+                    raise TypeError(f"Unknown upstream step: {step!r}")
+            except Exception as e:
+                error = e
+    except StopIteration as stop:
+        return stop.value
+
+CACHED_CALLS = []  # memoized UpstreamCalls, for cache statistics
+
+class UpstreamCall:
+    """
+    Wraps a flow function. Calling it runs the flow synchronously (drop-in for the plain function),
+    .flow() returns the generator for use with `yield from` or run_async().
+    With cached=True results are memoized per arguments like functools.lru_cache(maxsize=None).
+    """
+
+    def __init__(self, function, cached=False):
+        update_wrapper(self, function)
+        self.function = function
+        self.cached = cached
+        self._cache = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if cached:
+            CACHED_CALLS.append(self)
+
+    def __call__(self, *args, **kwargs):
+        return run_sync(self.flow(*args, **kwargs))
+
+    def flow(self, *args, **kwargs):
+        if not self.cached:
+            return self.function(*args, **kwargs)
+        return self._cached_flow(args, kwargs)
+
+    def _cached_flow(self, args, kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        with self._lock:
+            hit = key in self._cache
+            if hit:
+                self.hits += 1
+                value = self._cache[key]
+            else:
+                self.misses += 1
+        notify_lookup(self.__name__, hit)
+        if hit:
+            return value
+        value = yield from self.function(*args, **kwargs)
+        with self._lock:
+            self._cache[key] = value
+        return value
+
+    def cache_info(self):
+        return {'hits': self.hits, 'misses': self.misses, 'currsize': len(self._cache)}
+
+    def cache_clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+def call(function=None, *, cached=False):
+    """Decorator turning a flow function into an UpstreamCall: @upstream.call or @upstream.call(cached=True)"""
+    if function is None:
+        return lambda function: UpstreamCall(function, cached=cached)
+    return UpstreamCall(function, cached=cached)
+
+def view(function):
+    """Decorator for Flask views written as flows. Flask runs them synchronously, the async server uses .upstream_flow"""
+    def wrapper(*args, **kwargs):
+        return run_sync(function(*args, **kwargs))
+    update_wrapper(wrapper, function)
+    wrapper.upstream_flow = function
+    return wrapper
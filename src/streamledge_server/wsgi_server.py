@@ -0,0 +1,125 @@
+import queue
+import threading
+import time
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+_STOP = object()  # worker shutdown sentinel
+
+class PooledRequestHandler(WSGIRequestHandler):
+    # HTTP/1.1 for chunked (streamed) responses. Werkzeug still closes the connection after each response,
+    # it drains unread input from the socket and so can't safely read a second request on it.
+    protocol_version = "HTTP/1.1"
+    # Socket timeout, so a slow or stalled client can only hold a worker this long per read/write
+    timeout = 5
+
+class PooledWSGIServer(BaseWSGIServer):
+    """
+    Werkzeug WSGI server that handles connections on a fixed pool of worker threads.
+    Accepted connections wait in a bounded queue for a free worker. When the queue is full the
+    connection is answered with 503 and a Retry-After header instead of starting another thread.
+    """
+
+    multithread = True
+    RETRY_AFTER = 1  # seconds
+
+    def __init__(self, host, port, app, workers=8, request_queue=32, connection_timeout=5, handler=PooledRequestHandler, fd=None):
+        handler = type(handler.__name__, (handler,), {'timeout': connection_timeout})
+        super().__init__(host, port, app, handler=handler, fd=fd)
+        self.workers = workers
+        self.rejected = 0  # connections turned away with 503
+        self._queue = queue.Queue(maxsize=request_queue)
+        self._busy = 0
+        self._busy_lock = threading.Lock()
+        self._serving = False
+        self._closing = False
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"wsgi-worker-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def serve_forever(self, poll_interval=0.5):
+        self._serving = True
+        try:
+            super().serve_forever(poll_interval)
+        finally:
+            self._serving = False
+
+    def process_request(self, request, client_address):
+        try:
+            self._queue.put_nowait((request, client_address))
+        except queue.Full:
+            self._reject(request)
+
+    def _reject(self, request):
+        self.rejected += 1
+        body = b"Server is busy, please retry.\n"
+        try:
+            # Read the request first so closing the socket doesn't reset the connection before the client sees the 503
+            request.settimeout(0.05)
+            request.recv(65536)
+        except OSError:
+            pass
+        try:
+            request.sendall(
+                b"HTTP/1.1 503 Service Unavailable\r\n"
+                + f"Retry-After: {self.RETRY_AFTER}\r\n".encode()
+                + b"Content-Type: text/plain; charset=utf-8\r\n"
+                + f"Content-Length: {len(body)}\r\n".encode()
+                + b"Connection: close\r\n\r\n"
+                + body
+            )
+        except OSError:
+            pass
+        self.shutdown_request(request)
+
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            request, client_address = item
+            with self._busy_lock:
+                self._busy += 1
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+                with self._busy_lock:
+                    self._busy -= 1
+
+    def stats(self):
+        with self._busy_lock:
+            busy = self._busy
+        return {
+            'workers': self.workers,
+            'busy': busy,
+            'queued': self._queue.qsize(),
+            'queue_size': self._queue.maxsize,
+            'rejected': self.rejected,
+        }
+
+    def shutdown_gracefully(self, timeout=10):
+        """
+        Stop accepting connections, let queued and running requests finish (for up to `timeout` seconds)
+        and close the listening socket. Safe to call from any thread except the one running serve_forever().
+        """
+        if self._closing:
+            return
+        self._closing = True
+        if self._serving:
+            self.shutdown()
+
+        deadline = time.monotonic() + timeout
+        for _ in self._threads:
+            try:
+                self._queue.put(_STOP, timeout=max(0, deadline - time.monotonic()))
+            except queue.Full:
+                break
+        for thread in self._threads:
+            thread.join(max(0, deadline - time.monotonic()))
+        self.server_close()
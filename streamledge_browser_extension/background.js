@@ -14,14 +14,19 @@ function shouldIgnoreUrl(url, platform) {
   return platformIgnorePaths[platform].includes(pathParts[0].toLowerCase());
 }
 
+// Launch ID and click time, so the player page can report how long the launch took
+function launchParams() {
+  return `launchId=${crypto.randomUUID().replaceAll('-', '')}&launchTs=${Date.now()}&launchSource=extension`;
+}
+
 // Helper to open tab
 function openTab(endpoint) {
-  chrome.tabs.create({ url: `http://localhost:${PORT}/${endpoint}` });
+  chrome.tabs.create({ url: `http://localhost:${PORT}/${endpoint}&${launchParams()}` });
 }
 
 // Helper to fetch Streamledge
 function fetchStreamledge(endpoint) {
-  fetch(`http://localhost:${PORT}/${endpoint}&runStreamledge=1`);
+  fetch(`http://localhost:${PORT}/${endpoint}&runStreamledge=1&${launchParams()}`);
 }
 
 // Unified Twitch clip handler